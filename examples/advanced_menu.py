@@ -4,13 +4,26 @@ This example demonstrates:
 - Multi-level menu navigation
 - Breadcrumb tracking
 - Complex parameter passing
-- Pagination
+- Keyset pagination
+- Per-chat callback queues (ordered per chat, concurrent across chats)
+- Throttling outgoing Bot API calls with a custom rate limiter
 """
 
+import asyncio
 import logging
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
 from typing import Any
 from telegram import Update
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
+from telegram.ext import (
+    Application,
+    BaseRateLimiter,
+    CommandHandler,
+    CallbackQueryHandler,
+    ContextTypes,
+)
 
 from telegram_menu_builder import MenuBuilder, MenuRouter
 
@@ -23,25 +36,192 @@ logger = logging.getLogger(__name__)
 router = MenuRouter()
 
 
-# Mock database
-USERS = [
-    {"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "active": i % 2 == 0}
+class PerChatDispatcher:
+    """Route callback queries on per-chat queues.
+
+    Callbacks from the same chat are routed one at a time, in arrival order, while
+    different chats are served concurrently. A slow menu build or storage write for
+    one chat therefore never delays callbacks from another chat.
+
+    Consumers are started with ``application.create_task``, so the application
+    awaits them when it stops. Because ``route`` returns before the callback is
+    handled, an exception escaping ``MenuRouter.route`` bypasses the error handlers
+    registered with ``application.add_error_handler``: it is only logged. Use
+    ``router.on_error`` to react to handler failures.
+    """
+
+    def __init__(self, router: MenuRouter, max_concurrency: int = 32) -> None:
+        self._router = router
+        self._queues: dict[int, asyncio.Queue[tuple[Update, ContextTypes.DEFAULT_TYPE]]] = {}
+        # Caps how many callbacks are being routed at once across all chats
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def route(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Enqueue the update on its chat's queue, starting a consumer if needed."""
+        chat_id = update.effective_chat.id if update.effective_chat else 0
+        queue = self._queues.get(chat_id)
+        if queue is None:
+            queue = self._queues[chat_id] = asyncio.Queue()
+            # The application keeps a reference to the task and awaits it on shutdown.
+            context.application.create_task(self._consume(chat_id, queue))
+        queue.put_nowait((update, context))
+
+    async def _consume(
+        self, chat_id: int, queue: asyncio.Queue[tuple[Update, ContextTypes.DEFAULT_TYPE]]
+    ) -> None:
+        """Drain one chat's queue sequentially, then retire the consumer."""
+        try:
+            while True:
+                update, context = await queue.get()
+                async with self._semaphore:
+                    try:
+                        await self._router.route(update, context)
+                    except Exception:
+                        # e.g. answering the query failed; keep serving this chat
+                        logger.exception("Routing a callback for chat %s failed", chat_id)
+                # No await between the emptiness check and the removal, so route()
+                # cannot enqueue onto a queue whose consumer has already exited.
+                if queue.empty():
+                    del self._queues[chat_id]
+                    return
+        finally:
+            # If the consumer exits any other way (e.g. cancelled), drop its queue so
+            # the chat's next callback starts a fresh consumer instead of queueing
+            # onto one that nothing drains.
+            if self._queues.get(chat_id) is queue:
+                del self._queues[chat_id]
+
+
+dispatcher = PerChatDispatcher(router)
+
+
+class TokenBucket:
+    """Token bucket allowing ``capacity`` calls in a burst, refilled at ``rate`` per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self._rate
+                self._tokens = min(self._capacity, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def _is_group_chat(chat_id: int | str) -> bool:
+    """Whether ``chat_id`` addresses a group or channel rather than a private chat."""
+    if isinstance(chat_id, str):
+        # "@username" (channels and supergroups only) or a stringified id like "-100123"
+        return chat_id.startswith(("@", "-"))
+    return chat_id < 0
+
+
+class MenuRateLimiter(BaseRateLimiter[None]):
+    """Throttle Bot API requests to stay under Telegram's flood limits.
+
+    Every request takes a token from a global bucket (30 requests/second). Requests
+    that target a chat also take one from that chat's bucket: 1/second for private
+    chats and 20/minute for groups and channels (negative chat ids, or ``"@username"``
+    strings, which Telegram only accepts for channels and supergroups). Menu handlers
+    that answer the query and then edit the message are smoothed out instead of
+    hitting 429s.
+
+    Per-chat buckets are kept in an LRU of at most ``max_chats`` entries, so a
+    long-running bot does not accumulate one bucket for every chat it ever served.
+    """
+
+    def __init__(self, max_chats: int = 10_000) -> None:
+        self._global = TokenBucket(rate=30, capacity=30)
+        self._chats: OrderedDict[int | str, TokenBucket] = OrderedDict()
+        self._max_chats = max_chats
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Drop per-chat buckets."""
+        self._chats.clear()
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is not None:
+            self._chats.move_to_end(chat_id)
+            return bucket
+        if _is_group_chat(chat_id):
+            bucket = TokenBucket(rate=20 / 60, capacity=20)
+        else:
+            bucket = TokenBucket(rate=1, capacity=1)
+        self._chats[chat_id] = bucket
+        if len(self._chats) > self._max_chats:
+            # Evict the least recently used chat; it starts with a full bucket if it returns.
+            self._chats.popitem(last=False)
+        return bucket
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, bool | dict[str, Any] | list[dict[str, Any]]]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: None,
+    ) -> bool | dict[str, Any] | list[dict[str, Any]]:
+        """Wait for the global and per-chat buckets, then perform the request."""
+        chat_id = data.get("chat_id")
+        if chat_id is not None:
+            await self._chat_bucket(chat_id).acquire()
+        await self._global.acquire()
+        return await callback(*args, **kwargs)
+
+
+# Mock database, indexed by user id for O(1) lookups
+USERS_BY_ID: dict[int, dict[str, Any]] = {
+    i: {"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "active": i % 2 == 0}
     for i in range(1, 26)  # 25 users
-]
+}
+
+# Sorted ids backing keyset pagination ("users with id > after_id")
+USER_IDS: list[int] = sorted(USERS_BY_ID)
+
+USERS_PER_PAGE = 5
+
+
+# The admin main menu never changes, so build it once at import time. to_markup() is
+# synchronous and storage-free, so it is safe to call outside an event loop.
+MAIN_MENU_MARKUP = (
+    MenuBuilder()
+    .add_item("👥 Manage Users", handler="user_management")
+    .add_item("📊 Statistics", handler="show_stats")
+    .add_item("⚙️ Settings", handler="show_settings")
+    .columns(2)
+    .to_markup()
+)
+
+MAIN_MENU_TEXT = "🎛️ Admin Panel\n\nSelect an option:"
+
+
+async def _send_main(update: Update) -> None:
+    """Send the main admin menu, editing the message when coming from a callback."""
+    if update.callback_query:
+        await update.callback_query.edit_message_text(MAIN_MENU_TEXT, reply_markup=MAIN_MENU_MARKUP)
+    else:
+        await update.message.reply_text(MAIN_MENU_TEXT, reply_markup=MAIN_MENU_MARKUP)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show main admin menu."""
-    menu = (
-        MenuBuilder()
-        .add_item("👥 Manage Users", handler="user_management")
-        .add_item("📊 Statistics", handler="show_stats")
-        .add_item("⚙️ Settings", handler="show_settings")
-        .columns(2)
-        .build()
-    )
-
-    await update.message.reply_text("🎛️ Admin Panel\n\nSelect an option:", reply_markup=menu)
+    await _send_main(update)
 
 
 @router.handler("user_management")
@@ -51,7 +231,7 @@ async def handle_user_management(
     """Show user management submenu."""
     menu = (
         MenuBuilder()
-        .add_item("📋 List Users", handler="list_users", page=1)
+        .add_item("📋 List Users", handler="list_users", after_id=0)
         .add_item("➕ Add User", handler="add_user")
         .add_item("🔍 Search User", handler="search_user")
         .columns(1)
@@ -68,46 +248,57 @@ async def handle_user_management(
 async def handle_list_users(
     update: Update, context: ContextTypes.DEFAULT_TYPE, params: dict[str, Any]
 ) -> None:
-    """List users with pagination."""
-    page = params.get("page", 1)
-    per_page = 5
+    """List users with keyset pagination.
 
-    # Calculate pagination
-    total_users = len(USERS)
-    total_pages = (total_users + per_page - 1) // per_page
-    start_idx = (page - 1) * per_page
-    end_idx = min(start_idx + per_page, total_users)
+    Pages are addressed by ``after_id`` (the last id shown on the previous page)
+    rather than a page number, so deleting a user never shifts or skips entries
+    on the pages around it.
+    """
+    after_id = params.get("after_id", 0)
 
-    users_on_page = USERS[start_idx:end_idx]
+    # Seek to the first user after the cursor
+    total_users = len(USER_IDS)
+    start_idx = bisect_right(USER_IDS, after_id)
+    end_idx = min(start_idx + USERS_PER_PAGE, total_users)
+    ids_on_page = USER_IDS[start_idx:end_idx]
 
     # Build menu
     builder = MenuBuilder()
 
     # Add user buttons
-    for user in users_on_page:
+    for user_id in ids_on_page:
+        user = USERS_BY_ID[user_id]
         status = "✅" if user["active"] else "❌"
         builder.add_item(
             f"{status} {user['name']}",
             handler="view_user",
-            user_id=user["id"],
-            page=page,  # Remember current page for back navigation
-            breadcrumb=["user_management", "list_users"],
+            user_id=user_id,
+            after_id=after_id,  # Remember current page for back navigation
+            breadcrumb=("user_management", "list_users"),
         )
 
     builder.columns(1)
 
-    # Add pagination buttons
-    if page > 1:
-        builder.add_back_button(text="⬅️ Previous", handler="list_users", page=page - 1)
+    # Add pagination buttons. "Previous" seeks back one page from the first id
+    # shown here, so no navigation history has to be kept between callbacks.
+    if start_idx > 0:
+        prev_idx = max(start_idx - USERS_PER_PAGE, 0)
+        prev_after_id = USER_IDS[prev_idx - 1] if prev_idx > 0 else 0
+        builder.add_back_button(
+            text="⬅️ Previous", handler="list_users", after_id=prev_after_id
+        )
 
-    if page < total_pages:
-        builder.add_next_button(text="➡️ Next", handler="list_users", page=page + 1)
+    if end_idx < total_users:
+        builder.add_next_button(text="➡️ Next", handler="list_users", after_id=ids_on_page[-1])
 
     # Add back to menu button
     builder.add_item("🔙 Back to Menu", handler="user_management")
 
     menu = builder.build()
 
+    page = start_idx // USERS_PER_PAGE + 1
+    total_pages = max((total_users + USERS_PER_PAGE - 1) // USERS_PER_PAGE, 1)
+
     await update.callback_query.edit_message_text(
         f"📋 Users (Page {page}/{total_pages})\n\n"
         f"Showing users {start_idx + 1}-{end_idx} of {total_users}",
@@ -115,57 +306,49 @@ async def handle_list_users(
     )
 
 
+# Constant structure of the user-details menu: (label, handler, static params,
+# whether the button extends the breadcrumb with "view_user")
+VIEW_USER_TEMPLATE: tuple[tuple[str, str, dict[str, Any], bool], ...] = (
+    ("✏️ Edit Name", "edit_user_field", {"field": "name"}, True),
+    ("📧 Edit Email", "edit_user_field", {"field": "email"}, True),
+    ("🔄 Toggle Active", "toggle_user_active", {}, False),
+    ("🗑️ Delete User", "confirm_delete_user", {}, False),
+)
+
+
 @router.handler("view_user")
 async def handle_view_user(
     update: Update, context: ContextTypes.DEFAULT_TYPE, params: dict[str, Any]
 ) -> None:
     """View user details."""
     user_id = params["user_id"]
-    page = params.get("page", 1)
-    breadcrumb = params.get("breadcrumb", [])
+    after_id = params.get("after_id", 0)
+    # Decoded params carry the breadcrumb as a JSON list; keep it as a tuple here
+    breadcrumb = tuple(params.get("breadcrumb", ()))
+    edit_crumb = (*breadcrumb, "view_user")
 
     # Find user
-    user = next((u for u in USERS if u["id"] == user_id), None)
+    user = USERS_BY_ID.get(user_id)
 
     if not user:
         await update.callback_query.answer("User not found", show_alert=True)
         return
 
-    # Build menu with edit options
-    menu = (
-        MenuBuilder()
-        .add_item(
-            "✏️ Edit Name",
-            handler="edit_user_field",
-            user_id=user_id,
-            field="name",
-            page=page,
-            breadcrumb=breadcrumb + ["view_user"],
-        )
-        .add_item(
-            "📧 Edit Email",
-            handler="edit_user_field",
-            user_id=user_id,
-            field="email",
-            page=page,
-            breadcrumb=breadcrumb + ["view_user"],
-        )
-        .add_item(
-            "🔄 Toggle Active",
-            handler="toggle_user_active",
-            user_id=user_id,
-            page=page,
-            breadcrumb=breadcrumb,
-        )
-        .add_item(
-            "🗑️ Delete User",
-            handler="confirm_delete_user",
+    # Build menu with edit options: only the per-user params vary, the rows come
+    # from the precomputed template
+    builder = MenuBuilder()
+    for label, handler, static_params, extends_crumb in VIEW_USER_TEMPLATE:
+        builder.add_item(
+            label,
+            handler=handler,
             user_id=user_id,
-            page=page,
-            breadcrumb=breadcrumb,
+            after_id=after_id,
+            breadcrumb=edit_crumb if extends_crumb else breadcrumb,
+            **static_params,
         )
-        .columns(2)
-        .add_back_button(text="🔙 Back to List", handler="list_users", page=page)
+    menu = (
+        builder.columns(2)
+        .add_back_button(text="🔙 Back to List", handler="list_users", after_id=after_id)
         .build()
     )
 
@@ -201,7 +384,7 @@ async def handle_toggle_user_active(
     user_id = params["user_id"]
 
     # Find and toggle user
-    user = next((u for u in USERS if u["id"] == user_id), None)
+    user = USERS_BY_ID.get(user_id)
     if user:
         user["active"] = not user["active"]
         status = "activated" if user["active"] else "deactivated"
@@ -217,12 +400,12 @@ async def handle_confirm_delete_user(
 ) -> None:
     """Show delete confirmation."""
     user_id = params["user_id"]
-    page = params.get("page", 1)
+    after_id = params.get("after_id", 0)
 
     menu = (
         MenuBuilder()
-        .add_item("⚠️ YES, DELETE", handler="delete_user", user_id=user_id, page=page)
-        .add_item("❌ Cancel", handler="view_user", user_id=user_id, page=page)
+        .add_item("⚠️ YES, DELETE", handler="delete_user", user_id=user_id, after_id=after_id)
+        .add_item("❌ Cancel", handler="view_user", user_id=user_id, after_id=after_id)
         .columns(1)
         .build()
     )
@@ -241,16 +424,16 @@ async def handle_delete_user(
 ) -> None:
     """Delete a user."""
     user_id = params["user_id"]
-    page = params.get("page", 1)
+    after_id = params.get("after_id", 0)
 
-    # Delete user
-    global USERS
-    USERS = [u for u in USERS if u["id"] != user_id]
+    # Delete user: a dict pop plus a binary search into the sorted id list
+    if USERS_BY_ID.pop(user_id, None) is not None:
+        del USER_IDS[bisect_left(USER_IDS, user_id)]
 
     await update.callback_query.answer("User deleted successfully")
 
     # Return to list
-    await handle_list_users(update, context, {"page": page})
+    await handle_list_users(update, context, {"after_id": after_id})
 
 
 @router.handler("go_home")
@@ -258,18 +441,7 @@ async def handle_go_home(
     update: Update, context: ContextTypes.DEFAULT_TYPE, params: dict[str, Any]
 ) -> None:
     """Go back to main menu."""
-    menu = (
-        MenuBuilder()
-        .add_item("👥 Manage Users", handler="user_management")
-        .add_item("📊 Statistics", handler="show_stats")
-        .add_item("⚙️ Settings", handler="show_settings")
-        .columns(2)
-        .build()
-    )
-
-    await update.callback_query.edit_message_text(
-        "🎛️ Admin Panel\n\nSelect an option:", reply_markup=menu
-    )
+    await _send_main(update)
 
 
 @router.handler("show_stats")
@@ -285,10 +457,16 @@ async def handle_not_implemented(
 
 def main() -> None:
     """Start the bot."""
-    application = Application.builder().token("YOUR_BOT_TOKEN_HERE").build()
+    application = (
+        Application.builder()
+        .token("YOUR_BOT_TOKEN_HERE")
+        .rate_limiter(MenuRateLimiter())
+        .build()
+    )
 
     application.add_handler(CommandHandler("start", start))
-    application.add_handler(CallbackQueryHandler(router.route))
+    # Route through the per-chat dispatcher rather than router.route directly
+    application.add_handler(CallbackQueryHandler(dispatcher.route))
 
     logger.info("Advanced example bot started")
     application.run_polling(allowed_updates=Update.ALL_TYPES)
@@ -13,7 +13,7 @@ See: https://github.com/python-telegram-bot/python-telegram-bot/wiki/Frequently-
 import logging
 from typing import Any
 
-from telegram import Update
+from telegram import InlineKeyboardMarkup, Update
 from telegram.ext import (
     Application,
     CallbackQueryHandler,
@@ -34,6 +34,7 @@ router = MenuRouter()
 
 # Mock data for pagination
 ITEMS = [f"Item {i}" for i in range(1, 101)]  # 100 items
+ITEMS_PER_PAGE = 10
 
 # Conversation states
 BROWSING = 0
@@ -55,49 +56,55 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     return BROWSING
 
 
-async def _show_page(
-    update: Update,
-    context: ContextTypes.DEFAULT_TYPE,
-    page: int
-) -> None:
-    """Display a page of items with navigation buttons."""
-    items_per_page = 10
-    start = page * items_per_page
-    end = start + items_per_page
-    page_items = ITEMS[start:end]
-    
-    total_pages = (len(ITEMS) + items_per_page - 1) // items_per_page
-    
-    # Build message
-    message = f"📋 Page {page + 1}/{total_pages}\n\n"
-    message += "\n".join(f"• {item}" for item in page_items)
-    
-    # Build navigation menu
+def _build_nav(page: int, total_pages: int) -> InlineKeyboardMarkup:
+    """Build the Previous/Next navigation menu for one page."""
     builder = MenuBuilder()
-    
+    has_prev = page > 0
+    has_next = page < total_pages - 1
+
     # Add navigation buttons in a row
-    nav_buttons = []
-    if page > 0:
+    if has_prev:
         builder.add_item(
             "⬅️ Previous",
             handler="paginate",
             page=page - 1
         )
-    
-    if end < len(ITEMS):
+
+    if has_next:
         builder.add_item(
             "Next ➡️",
             handler="paginate",
             page=page + 1
         )
-    
+
     # Set columns based on number of buttons
-    if page > 0 and end < len(ITEMS):
-        builder.columns(2)  # Both prev and next
-    else:
-        builder.columns(1)  # Only one button
-    
-    menu = builder.build()
+    builder.columns(2 if has_prev and has_next else 1)
+
+    # to_markup() is synchronous and storage-free, so it can run at import time
+    return builder.to_markup()
+
+
+# ITEMS never changes at runtime, so render every page (text + menu) once at
+# import time. Pagination then becomes two list lookups per callback.
+TOTAL_PAGES = (len(ITEMS) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
+PAGE_TEXTS: list[str] = []
+PAGE_MARKUPS: list[InlineKeyboardMarkup] = []
+for _page in range(TOTAL_PAGES):
+    _body = "\n".join(
+        f"• {item}" for item in ITEMS[_page * ITEMS_PER_PAGE : (_page + 1) * ITEMS_PER_PAGE]
+    )
+    PAGE_TEXTS.append(f"📋 Page {_page + 1}/{TOTAL_PAGES}\n\n{_body}")
+    PAGE_MARKUPS.append(_build_nav(_page, TOTAL_PAGES))
+
+
+async def _show_page(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    page: int
+) -> None:
+    """Display a page of items with navigation buttons."""
+    message = PAGE_TEXTS[page]
+    menu = PAGE_MARKUPS[page]
     
     # Send or edit message
     if update.callback_query:
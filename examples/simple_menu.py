@@ -21,20 +21,47 @@ logger = logging.getLogger(__name__)
 router = MenuRouter()
 
 
+# The settings menu is static, so build it once at import time and reuse it.
+# to_markup() is synchronous and storage-free, so it runs fine outside an event loop.
+SETTINGS_MENU_MARKUP = (
+    MenuBuilder()
+    .add_item("🌍 Language", handler="select_language")
+    .add_item("👤 Profile", handler="show_profile")
+    .add_item("🔔 Notifications", handler="toggle_notifications")
+    .columns(2)
+    .add_exit_button(text="❌ Close", handler="close_menu")
+    .to_markup()
+)
+
+SETTINGS_MENU_TEXT = "⚙️ Settings\n\nChoose an option:"
+
+
+async def _send_main(update: Update) -> None:
+    """Send the settings menu, editing the message when coming from a callback."""
+    if update.callback_query:
+        await update.callback_query.edit_message_text(
+            SETTINGS_MENU_TEXT, reply_markup=SETTINGS_MENU_MARKUP
+        )
+    else:
+        await update.message.reply_text(SETTINGS_MENU_TEXT, reply_markup=SETTINGS_MENU_MARKUP)
+
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message with settings menu."""
-    # Create a simple menu
-    menu = (
-        MenuBuilder()
-        .add_item("🌍 Language", handler="select_language")
-        .add_item("👤 Profile", handler="show_profile")
-        .add_item("🔔 Notifications", handler="toggle_notifications")
-        .columns(2)
-        .add_exit_button(text="❌ Close", handler="close_menu")
-        .build()
-    )
-
-    await update.message.reply_text("⚙️ Settings\n\nChoose an option:", reply_markup=menu)
+    await _send_main(update)
+
+
+# The language picker has no per-user params either, so it is prebuilt too.
+LANGUAGE_MENU_MARKUP = (
+    MenuBuilder()
+    .add_item("🇮🇹 Italiano", handler="set_language", lang="it")
+    .add_item("🇬🇧 English", handler="set_language", lang="en")
+    .add_item("🇪🇸 Español", handler="set_language", lang="es")
+    .add_item("🇩🇪 Deutsch", handler="set_language", lang="de")
+    .columns(2)
+    .add_back_button(handler="show_main_menu")
+    .to_markup()
+)
 
 
 @router.handler("select_language")
@@ -42,19 +69,10 @@ async def handle_language_selection(
     update: Update, context: ContextTypes.DEFAULT_TYPE, params: dict
 ) -> None:
     """Show language selection submenu."""
-    menu = (
-        MenuBuilder()
-        .add_item("🇮🇹 Italiano", handler="set_language", lang="it")
-        .add_item("🇬🇧 English", handler="set_language", lang="en")
-        .add_item("🇪🇸 Español", handler="set_language", lang="es")
-        .add_item("🇩🇪 Deutsch", handler="set_language", lang="de")
-        .columns(2)
-        .add_back_button(handler="show_main_menu")
-        .build()
+    await update.callback_query.edit_message_text(
+        "🌍 Select your language:", reply_markup=LANGUAGE_MENU_MARKUP
     )
 
-    await update.callback_query.edit_message_text("🌍 Select your language:", reply_markup=menu)
-
 
 @router.handler("set_language")
 async def handle_set_language(
@@ -77,19 +95,7 @@ async def handle_set_language(
 @router.handler("show_main_menu")
 async def show_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, params: dict) -> None:
     """Show main settings menu."""
-    menu = (
-        MenuBuilder()
-        .add_item("🌍 Language", handler="select_language")
-        .add_item("👤 Profile", handler="show_profile")
-        .add_item("🔔 Notifications", handler="toggle_notifications")
-        .columns(2)
-        .add_exit_button(text="❌ Close", handler="close_menu")
-        .build()
-    )
-
-    await update.callback_query.edit_message_text(
-        "⚙️ Settings\n\nChoose an option:", reply_markup=menu
-    )
+    await _send_main(update)
 
 
 @router.handler("show_profile")
@@ -15,6 +15,7 @@ from telegram import InlineKeyboardMarkup
 from telegram_menu_builder.encoding import CallbackEncoder
 from telegram_menu_builder.storage import MemoryStorage, StorageBackend
 from telegram_menu_builder.types import (
+    EncodingError,
     LayoutConfig,
     MenuAction,
     MenuItem,
@@ -24,7 +25,7 @@ from telegram_menu_builder.types import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class _CallbackItemSpec:
     """A pending callback menu item awaiting encoding at build time."""
 
@@ -33,7 +34,7 @@ class _CallbackItemSpec:
     params: dict[str, Any] = field(default_factory=dict[str, Any])
 
 
-@dataclass
+@dataclass(slots=True)
 class _UrlItemSpec:
     """A pending URL menu item (no callback data to encode)."""
 
@@ -71,6 +72,18 @@ class MenuBuilder:
         ...     .build())
     """
 
+    __slots__ = (
+        "_encoder",
+        "_items",
+        "_layout",
+        "_menu_id",
+        "_navigation",
+        "_on_oversize",
+        "_storage",
+        "_storage_explicit",
+        "_submenus",
+    )
+
     def __init__(
         self,
         storage: StorageBackend | None = None,
@@ -89,6 +102,8 @@ class MenuBuilder:
                 instead, keeping every menu fully inline and storage-free.
         """
         self._storage = storage or MemoryStorage()
+        # A builder without an explicit storage adopts its parent's in add_submenu().
+        self._storage_explicit = storage is not None
         self._encoder = CallbackEncoder(self._storage)
         self._menu_id = menu_id
         self._on_oversize: Literal["spill", "error"] = on_oversize
@@ -161,7 +176,10 @@ class MenuBuilder:
     ) -> Self:
         """Add a button that opens a submenu.
 
-        The submenu builder will be stored and can be built later.
+        The submenu builder will be stored and can be built later. A submenu
+        created without an explicit ``storage`` (and, recursively, its own
+        submenus) switches to this builder's storage and encoder, so the whole
+        menu tree spills into one backend and shares one key cache.
 
         Args:
             text: Button display text
@@ -183,6 +201,7 @@ class MenuBuilder:
         submenu_id = id(submenu)
         self._submenus[submenu_id] = submenu
         params["_submenu_id"] = submenu_id
+        submenu._adopt_storage(self._storage, self._encoder)
 
         return self.add_item(text, handler, **params)
 
@@ -198,6 +217,19 @@ class MenuBuilder:
         """
         return self._submenus.get(submenu_id)
 
+    def _adopt_storage(self, storage: StorageBackend, encoder: CallbackEncoder) -> None:
+        """Switch this builder and its submenus to a parent's storage and encoder.
+
+        Builders created with an explicit ``storage`` keep it. The identity check
+        also stops the recursion on submenu cycles.
+        """
+        if self._storage_explicit or self._storage is storage:
+            return
+        self._storage = storage
+        self._encoder = encoder
+        for submenu in self._submenus.values():
+            submenu._adopt_storage(storage, encoder)
+
     def columns(self, n: int) -> Self:
         """Set number of columns in the grid layout.
 
@@ -250,6 +282,9 @@ class MenuBuilder:
             Self for chaining.
         """
         button = NavigationButton(text=text, handler=handler, params=params)
+        # Validate the button's action once, here, so every build can construct it
+        # with model_construct() instead of re-validating it.
+        MenuAction(handler=button.handler, params=button.params)
         match slot:
             case "back_button":
                 self._navigation.back_button = button
@@ -338,48 +373,51 @@ class MenuBuilder:
     def build(self) -> InlineKeyboardMarkup:
         """Build the final InlineKeyboardMarkup.
 
-        This is a synchronous convenience wrapper around :meth:`build_async` that
-        encodes all callback data and assembles the keyboard.
-
-        When called outside an event loop it drives the async build directly. When
-        called from within a running event loop (e.g. inside an async handler) the
-        async build is executed on a short-lived worker thread so this synchronous
-        API keeps working. In async code, prefer ``await build_async()`` directly.
+        This is the synchronous counterpart of :meth:`build_async`. Every callback
+        is first encoded inline, so a menu whose callbacks all fit the 64-byte
+        budget is assembled without creating an event loop or thread. Only the
+        items that must spill to storage are then encoded in a single
+        ``asyncio.run`` (or, when called from within a running event loop, on a
+        short-lived worker thread so this synchronous API keeps working). In async
+        code, prefer ``await build_async()`` directly.
 
         Returns:
             InlineKeyboardMarkup ready to use with python-telegram-bot
 
         Raises:
             ValidationError: If menu configuration is invalid
+            EncodingError: If ``on_oversize="error"`` and an item does not fit inline
 
         Example:
             >>> menu = builder.build()
             >>> await update.message.reply_text("Choose:", reply_markup=menu)
         """
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            # No running loop: safe to drive the async build directly.
-            return asyncio.run(self.build_async())
+        if self._on_oversize == "error":
+            # "error" mode never touches storage; to_markup raises on oversize.
+            return self.to_markup()
 
-        # A loop is already running in this thread: run the async build on a
-        # dedicated worker thread (with its own event loop) and wait for it.
-        result: list[InlineKeyboardMarkup] = []
-        error: list[Exception] = []
+        self._require_non_empty()
 
-        def _runner() -> None:
+        nav_specs = self._navigation_button_rows()
+        actions = self._collect_actions(nav_specs)
+
+        # Encode inline where possible; an empty slot marks a deferred
+        # storage-backed encode that is finalized below in one batch.
+        callbacks: list[str] = []
+        pending: list[int] = []
+        for index, action in enumerate(actions):
             try:
-                result.append(asyncio.run(self.build_async()))
-            except Exception as exc:  # re-raised on the calling thread below
-                error.append(exc)
+                callbacks.append(self._encoder.encode_inline(action))
+            except EncodingError:
+                callbacks.append("")
+                pending.append(index)
 
-        thread = threading.Thread(target=_runner, daemon=True)
-        thread.start()
-        thread.join()
+        if pending:
+            spilled = self._finalize_pending([actions[index] for index in pending])
+            for index, callback_data in zip(pending, spilled, strict=True):
+                callbacks[index] = callback_data
 
-        if error:
-            raise error[0]
-        return result[0]
+        return self._markup_from_grid(self._grid_from_callbacks(callbacks, nav_specs))
 
     async def build_async(self) -> InlineKeyboardMarkup:
         """Build the final InlineKeyboardMarkup (async version).
@@ -403,21 +441,9 @@ class MenuBuilder:
         # Encode all pending item specs into MenuItems. Encoding is deferred from
         # the add_* calls to here so that it always runs inside an async context
         # (this is what guarantees non-empty callback_data, see build()).
-        items: list[MenuItem] = []
-        for spec in self._items:
-            if isinstance(spec, _UrlItemSpec):
-                items.append(MenuItem(text=spec.text, url=spec.url))
-            else:
-                items.append(await self._encode_callback_item(spec.text, spec.handler, spec.params))
-
-        nav_rows = [
-            [await self._encode_callback_item(btn.text, btn.handler, btn.params) for btn in row]
-            for row in self._navigation_button_rows()
-        ]
-
-        keyboard = self._assemble_grid(items, nav_rows)
-        telegram_keyboard = [[item.to_telegram_button() for item in row] for row in keyboard]
-        return InlineKeyboardMarkup(telegram_keyboard)
+        nav_specs = self._navigation_button_rows()
+        callbacks = await self._encode_actions(self._collect_actions(nav_specs))
+        return self._markup_from_grid(self._grid_from_callbacks(callbacks, nav_specs))
 
     def to_markup(self) -> InlineKeyboardMarkup:
         """Build the menu synchronously, without an event loop or storage.
@@ -437,9 +463,7 @@ class MenuBuilder:
             ValidationError: If menu configuration is invalid (empty menu).
             EncodingError: If any item does not fit within the 64-byte inline budget.
         """
-        keyboard = self._build_static_grid()
-        telegram_keyboard = [[item.to_telegram_button() for item in row] for row in keyboard]
-        return InlineKeyboardMarkup(telegram_keyboard)
+        return self._markup_from_grid(self._build_static_grid())
 
     def to_raw(self) -> dict[str, Any]:
         """Build the menu as a plain Telegram Bot API dict, without PTB or storage.
@@ -489,7 +513,9 @@ class MenuBuilder:
                 self._encoder.encode_inline(MenuAction(handler=spec.handler, params=spec.params))
         for row in self._navigation_button_rows():
             for btn in row:
-                self._encoder.encode_inline(MenuAction(handler=btn.handler, params=btn.params))
+                self._encoder.encode_inline(
+                    MenuAction.model_construct(handler=btn.handler, params=btn.params)
+                )
 
     def _build_static_grid(self) -> list[list[MenuItem]]:
         """Materialize all specs inline (no storage) and assemble the grid.
@@ -505,39 +531,85 @@ class MenuBuilder:
         """
         self._require_non_empty()
 
+        nav_specs = self._navigation_button_rows()
+        callbacks = [
+            self._encoder.encode_inline(action) for action in self._collect_actions(nav_specs)
+        ]
+        return self._grid_from_callbacks(callbacks, nav_specs)
+
+    def _collect_actions(self, nav_specs: list[list[NavigationButton]]) -> list[MenuAction]:
+        """Return the actions to encode for a build, in grid order.
+
+        Callback items come first (URL items carry no callback data), followed by
+        the navigation buttons row by row; :meth:`_grid_from_callbacks` consumes
+        the encoded callbacks in the same order.
+
+        Args:
+            nav_specs: The navigation rows from :meth:`_navigation_button_rows`.
+
+        Returns:
+            One MenuAction per callback button.
+        """
+        actions = [
+            MenuAction(handler=spec.handler, params=spec.params)
+            for spec in self._items
+            if isinstance(spec, _CallbackItemSpec)
+        ]
+        actions.extend(
+            MenuAction.model_construct(handler=btn.handler, params=btn.params)
+            for row in nav_specs
+            for btn in row
+        )
+        return actions
+
+    def _grid_from_callbacks(
+        self, callbacks: Sequence[str], nav_specs: list[list[NavigationButton]]
+    ) -> list[list[MenuItem]]:
+        """Pair already-encoded callbacks with their specs and assemble the grid.
+
+        Args:
+            callbacks: Encoded callback data, in :meth:`_collect_actions` order.
+            nav_specs: The navigation rows the trailing callbacks belong to.
+
+        Returns:
+            The grid of MenuItems including navigation rows.
+        """
+        remaining = iter(callbacks)
+
         items: list[MenuItem] = []
         for spec in self._items:
             if isinstance(spec, _UrlItemSpec):
                 items.append(MenuItem(text=spec.text, url=spec.url))
             else:
-                callback_data = self._encoder.encode_inline(
-                    MenuAction(handler=spec.handler, params=spec.params)
-                )
-                items.append(MenuItem(text=spec.text, callback_data=callback_data))
+                items.append(MenuItem(text=spec.text, callback_data=next(remaining)))
 
         nav_rows = [
-            [
-                MenuItem(
-                    text=btn.text,
-                    callback_data=self._encoder.encode_inline(
-                        MenuAction(handler=btn.handler, params=btn.params)
-                    ),
-                )
-                for btn in row
-            ]
-            for row in self._navigation_button_rows()
+            # Button text was validated by NavigationButton (a stricter limit than
+            # MenuItem's) and the callback data comes from the encoder.
+            [MenuItem.model_construct(text=btn.text, callback_data=next(remaining)) for btn in row]
+            for row in nav_specs
         ]
 
         return self._assemble_grid(items, nav_rows)
 
+    @staticmethod
+    def _markup_from_grid(keyboard: list[list[MenuItem]]) -> InlineKeyboardMarkup:
+        """Convert an assembled grid of MenuItems into an InlineKeyboardMarkup."""
+        return InlineKeyboardMarkup(
+            [[item.to_telegram_button() for item in row] for row in keyboard]
+        )
+
     def _assemble_grid(
-        self, items: Sequence[MenuItem], nav_rows: Sequence[Sequence[MenuItem]]
+        self, items: list[MenuItem], nav_rows: list[list[MenuItem]]
     ) -> list[list[MenuItem]]:
         """Arrange already-encoded items into a grid and append navigation rows.
 
         This is the single source of truth for layout (columns/max_rows) and is
         shared by :meth:`build_async`, :meth:`to_markup`, and :meth:`to_raw`.
 
+        The rows are built by slicing, so the grid is allocated at its final size
+        in one pass; both arguments are fresh per build, so they are not copied.
+
         Args:
             items: Already-encoded body items, in order.
             nav_rows: Already-encoded navigation rows to append after the body.
@@ -545,22 +617,13 @@ class MenuBuilder:
         Returns:
             The assembled grid of MenuItem rows.
         """
-        keyboard: list[list[MenuItem]] = []
-        current_row: list[MenuItem] = []
-        for item in items:
-            current_row.append(item)
-
-            if len(current_row) >= self._layout.columns:
-                keyboard.append(current_row)
-                current_row = []
-
-            if self._layout.max_rows and len(keyboard) >= self._layout.max_rows:
-                break
+        columns = self._layout.columns
+        if self._layout.max_rows:
+            # Items that would fall past the last allowed row are dropped.
+            items = items[: columns * self._layout.max_rows]
 
-        if current_row:
-            keyboard.append(current_row)
-
-        keyboard.extend([list(row) for row in nav_rows])
+        keyboard = [items[i : i + columns] for i in range(0, len(items), columns)]
+        keyboard += nav_rows
         return keyboard
 
     def _require_non_empty(self) -> None:
@@ -568,20 +631,55 @@ class MenuBuilder:
         if not self._items and not self._has_navigation_buttons():
             raise ValidationError("Cannot build empty menu (no items or navigation buttons)")
 
-    async def _encode_callback_item(
-        self, text: str, handler: str, params: dict[str, Any]
-    ) -> MenuItem:
-        """Create a MenuItem with encoded callback data (async, may spill).
+    async def _encode_actions(self, actions: Sequence[MenuAction]) -> list[str]:
+        """Encode callback data for a whole build (async, may spill).
 
         Honors ``on_oversize``: ``"error"`` uses the inline-only encoder (which
-        raises on oversize), while ``"spill"`` uses the full encoder that falls
-        back to storage.
+        raises on oversize), while ``"spill"`` uses the batch encoder that falls
+        back to storage and encodes identical actions only once.
         """
-        action = MenuAction(handler=handler, params=params)
         if self._on_oversize == "error":
-            return MenuItem(text=text, callback_data=self._encoder.encode_inline(action))
-        callback_data = await self._encoder.encode(action)
-        return MenuItem(text=text, callback_data=callback_data)
+            return [self._encoder.encode_inline(action) for action in actions]
+        return await self._encoder.encode_many(actions)
+
+    def _finalize_pending(self, actions: list[MenuAction]) -> list[str]:
+        """Encode the actions :meth:`build` could not fit inline (may spill).
+
+        All pending actions are encoded in one ``asyncio.run`` so the loop setup
+        is paid once per build. When a loop is already running in this thread
+        (``build()`` called from async code), the batch runs on a dedicated worker
+        thread with its own event loop instead.
+
+        Args:
+            actions: The actions whose inline encoding failed.
+
+        Returns:
+            The encoded callback data, in the same order as ``actions``.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: safe to drive the batch encode directly.
+            return asyncio.run(self._encoder.encode_many(actions))
+
+        # A loop is already running in this thread: encode on a dedicated worker
+        # thread (with its own event loop) and wait for it.
+        result: list[list[str]] = []
+        error: list[Exception] = []
+
+        def _runner() -> None:
+            try:
+                result.append(asyncio.run(self._encoder.encode_many(actions)))
+            except Exception as exc:  # re-raised on the calling thread below
+                error.append(exc)
+
+        thread = threading.Thread(target=_runner, daemon=True)
+        thread.start()
+        thread.join()
+
+        if error:
+            raise error[0]
+        return result[0]
 
     def _navigation_button_rows(self) -> list[list[NavigationButton]]:
         """Return navigation buttons grouped into their keyboard rows.
@@ -593,32 +691,27 @@ class MenuBuilder:
         Returns:
             The navigation rows, omitting any that have no buttons.
         """
+        nav = self._navigation
         rows: list[list[NavigationButton]] = []
 
-        back_next_row: list[NavigationButton] = []
-        if self._navigation.back_button:
-            back_next_row.append(self._navigation.back_button)
-        if self._navigation.next_button:
-            back_next_row.append(self._navigation.next_button)
+        back_next_row = [btn for btn in (nav.back_button, nav.next_button) if btn is not None]
         if back_next_row:
             rows.append(back_next_row)
 
-        if self._navigation.exit_button:
-            rows.append([self._navigation.exit_button])
-        elif self._navigation.cancel_button:
-            rows.append([self._navigation.cancel_button])
+        closing_button = nav.exit_button or nav.cancel_button
+        if closing_button is not None:
+            rows.append([closing_button])
 
         return rows
 
     def _has_navigation_buttons(self) -> bool:
         """Check if any navigation buttons are configured."""
-        return any(
-            [
-                self._navigation.back_button,
-                self._navigation.next_button,
-                self._navigation.exit_button,
-                self._navigation.cancel_button,
-            ]
+        nav = self._navigation
+        return (
+            nav.back_button is not None
+            or nav.next_button is not None
+            or nav.exit_button is not None
+            or nav.cancel_button is not None
         )
 
     @property
@@ -4,13 +4,17 @@ This module handles the intelligent encoding and decoding of callback data,
 automatically selecting the best storage strategy based on data size.
 """
 
+import asyncio
 import base64
 import hashlib
 import json
+import math
 import zlib
-from typing import Any
+from collections.abc import Mapping, Sequence
+from types import ModuleType
+from typing import Any, ClassVar, cast
 
-from telegram_menu_builder.storage.base import StorageBackend
+from telegram_menu_builder.storage.base import BaseStorage, StorageBackend
 from telegram_menu_builder.types import (
     DecodingError,
     EncodingError,
@@ -18,6 +22,31 @@ from telegram_menu_builder.types import (
     StorageStrategy,
 )
 
+# orjson is an optional speedup for canonical serialization; stdlib json is the fallback.
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+# Raw DEFLATE (no zlib header or Adler-32 trailer) saves 6 bytes of the 64-byte budget.
+_DEFLATE_WBITS = -15
+
+# On payloads this small higher levels find no longer matches, so the fastest level
+# yields the same compressed size.
+_DEFLATE_LEVEL = 1
+
+# BLAKE2b digest size in bytes; 6 bytes give the same 12-hex-char keys MD5[:12] did.
+_KEY_DIGEST_SIZE = 6
+
+# Upper bound on memoized storage keys per encoder; the cache is dropped when full.
+_KEY_CACHE_SIZE = 1024
+
+# json.dumps() builds a new JSONEncoder whenever it gets non-default options; these
+# stateless, preconfigured instances are shared instead.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 class CallbackEncoder:
     """Handles encoding and decoding of callback data with intelligent compression.
@@ -30,6 +59,7 @@ class CallbackEncoder:
     Attributes:
         storage: Storage backend for non-inline data
         prefix_inline: Prefix for inline data ('I:')
+        prefix_handler: Prefix for parameterless actions ('H:')
         prefix_short: Prefix for short-term storage ('S:')
         prefix_persistent: Prefix for persistent storage ('P:')
 
@@ -40,15 +70,37 @@ class CallbackEncoder:
         >>> decoded = await encoder.decode(encoded)
     """
 
+    # Constants are ClassVars so they stay class attributes when compiled with mypyc.
+
     # Constants for size thresholds (in bytes)
-    INLINE_THRESHOLD = 60  # Telegram callback_data is 64 bytes, leave 4 for prefix
-    SHORT_THRESHOLD = 500
+    INLINE_THRESHOLD: ClassVar[int] = 60  # Telegram callback_data is 64 bytes, leave 4 for prefix
+    SHORT_THRESHOLD: ClassVar[int] = 500
 
     # Prefixes for different storage strategies
-    PREFIX_INLINE = "I:"
-    PREFIX_INLINE_COMPRESSED = "IC:"
-    PREFIX_SHORT = "S:"
-    PREFIX_PERSISTENT = "P:"
+    PREFIX_INLINE: ClassVar[str] = "I:"
+    # Parameterless action: the handler name verbatim, with no JSON at all.
+    PREFIX_HANDLER: ClassVar[str] = "H:"
+    PREFIX_INLINE_COMPRESSED: ClassVar[str] = "IZ:"
+    # Legacy compressed tier (zlib + base64). Still decoded so buttons already sent
+    # to chats keep working, but no longer produced.
+    PREFIX_INLINE_COMPRESSED_LEGACY: ClassVar[str] = "IC:"
+    PREFIX_SHORT: ClassVar[str] = "S:"
+    PREFIX_PERSISTENT: ClassVar[str] = "P:"
+
+    # Decode dispatch table: every prefix is 2 or 3 characters long, so decoding
+    # needs at most two dict lookups instead of a chain of startswith() scans. The
+    # keys are spelled out because mypyc cannot resolve class attributes referenced
+    # from within the class body.
+    _PREFIX_STRATEGIES: ClassVar[dict[str, StorageStrategy]] = {
+        "I:": StorageStrategy.INLINE,
+        "H:": StorageStrategy.INLINE,
+        "IZ:": StorageStrategy.INLINE,
+        "IC:": StorageStrategy.INLINE,
+        "S:": StorageStrategy.SHORT,
+        "P:": StorageStrategy.PERSISTENT,
+    }
+
+    __slots__ = ("_key_cache", "storage")
 
     def __init__(self, storage: StorageBackend) -> None:
         """Initialize encoder with storage backend.
@@ -57,6 +109,8 @@ class CallbackEncoder:
             storage: Storage backend for non-inline data
         """
         self.storage = storage
+        # Canonical JSON -> storage key, so repeated payloads skip re-hashing.
+        self._key_cache: dict[bytes, str] = {}
 
     async def encode(
         self, action: MenuAction, force_strategy: StorageStrategy | None = None
@@ -87,7 +141,8 @@ class CallbackEncoder:
                     return inline_encoded
 
             # Determine storage strategy
-            json_size = len(json.dumps(data, separators=(",", ":")))
+            canonical = _canonical_json(data)
+            json_size = len(canonical)
 
             if force_strategy:
                 strategy = force_strategy
@@ -97,7 +152,7 @@ class CallbackEncoder:
                 strategy = StorageStrategy.PERSISTENT
 
             # Store externally and return reference
-            key = self._generate_key(data)
+            key = self._generate_key(canonical)
 
             if strategy == StorageStrategy.SHORT:
                 await self.storage.set(key, data, ttl=action.ttl)
@@ -109,12 +164,42 @@ class CallbackEncoder:
         except Exception as e:
             raise EncodingError(f"Failed to encode callback data: {e}") from e
 
+    async def encode_many(self, actions: Sequence[MenuAction]) -> list[str]:
+        """Encode several actions, encoding each distinct action only once.
+
+        Menus often repeat a payload (the same pagination target or row id on
+        several buttons). Identical actions share one encoded callback_data, so a
+        menu with N buttons but K distinct payloads performs K encodes and at most
+        K storage writes. The distinct encodes run concurrently, so with a remote
+        backend the storage round-trips overlap instead of adding up.
+
+        Args:
+            actions: MenuActions to encode, in order.
+
+        Returns:
+            Encoded callback_data strings, one per action and in the same order.
+
+        Raises:
+            EncodingError: If encoding any action fails
+        """
+        distinct: dict[str, MenuAction] = {}
+        order: list[str] = []
+        for action in actions:
+            # ttl is part of the identity: it decides how a SHORT spill is stored.
+            dedup_key = _COMPACT_JSON.encode([action.handler, action.params, action.ttl])
+            distinct.setdefault(dedup_key, action)
+            order.append(dedup_key)
+
+        encoded = await asyncio.gather(*(self.encode(action) for action in distinct.values()))
+        by_key = dict(zip(distinct, encoded, strict=True))
+        return [by_key[dedup_key] for dedup_key in order]
+
     def encode_inline(self, action: MenuAction) -> str:
         """Encode a MenuAction using only the inline (storage-free) path.
 
         This is the synchronous counterpart to :meth:`encode`. It builds the same
         ``{"h": handler, "p": params}`` dict and runs *only* the inline strategy
-        (JSON -> zlib -> base64). Unlike :meth:`encode`, it never spills to storage
+        (JSON -> DEFLATE -> base85). Unlike :meth:`encode`, it never spills to storage
         and performs no ``await``: if the resulting callback_data would not fit
         inline (i.e. it would otherwise require a storage spill), an
         :class:`EncodingError` is raised instead.
@@ -123,7 +208,7 @@ class CallbackEncoder:
             action: MenuAction to encode.
 
         Returns:
-            Encoded callback_data string (``I:``/``IC:`` prefix, max 64 bytes).
+            Encoded callback_data string (``H:``/``I:``/``IZ:`` prefix, max 64 bytes).
 
         Raises:
             EncodingError: If the action does not fit within the 64-byte inline
@@ -138,7 +223,7 @@ class CallbackEncoder:
         if inline_encoded is not None and len(inline_encoded) <= 64:
             return inline_encoded
 
-        json_size = len(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        json_size = len(_COMPACT_JSON.encode(data))
         message = (
             f"Callback for handler {action.handler!r} is {json_size}B encoded and exceeds the "
             "64B inline budget; it would require storage — use build_async() or shrink the params."
@@ -158,23 +243,22 @@ class CallbackEncoder:
             DecodingError: If decoding fails or data not found
         """
         try:
-            # Check prefix to determine decoding strategy
-            if callback_data.startswith((self.PREFIX_INLINE_COMPRESSED, self.PREFIX_INLINE)):
+            # Look the prefix up to determine the decoding strategy
+            prefix = self._match_prefix(callback_data)
+            if prefix is None:
+                raise DecodingError(f"Unknown callback_data format: {callback_data[:10]}...")
+
+            strategy = self._PREFIX_STRATEGIES[prefix]
+            # Members of the dispatch table are singletons: an identity check avoids
+            # StrEnum's string comparison.
+            if strategy is StorageStrategy.INLINE:
                 data = self._decode_inline(callback_data)
-            elif callback_data.startswith(self.PREFIX_SHORT):
-                key = callback_data[len(self.PREFIX_SHORT) :]
-                stored_data = await self.storage.get(key)
-                if stored_data is None:
-                    raise DecodingError(f"Callback data expired or not found: {key}")
-                data = stored_data
-            elif callback_data.startswith(self.PREFIX_PERSISTENT):
-                key = callback_data[len(self.PREFIX_PERSISTENT) :]
+            else:
+                key = callback_data[len(prefix) :]
                 stored_data = await self.storage.get(key)
                 if stored_data is None:
-                    raise DecodingError(f"Callback data not found: {key}")
+                    raise self._not_found_error(strategy, key)
                 data = stored_data
-            else:
-                raise DecodingError(f"Unknown callback_data format: {callback_data[:10]}...")
 
             # Reconstruct MenuAction
             return MenuAction(
@@ -187,17 +271,79 @@ class CallbackEncoder:
                 raise
             raise DecodingError(f"Failed to decode callback data: {e}") from e
 
+    async def decode_many(self, callbacks: Sequence[str]) -> list[MenuAction]:
+        """Decode several callback_data strings with one batched storage read.
+
+        Inline callbacks are decoded directly; the keys of all storage-backed
+        callbacks are fetched together via ``mget``, so re-rendering a menu from
+        N stored payloads costs one round-trip on backends with a native batch
+        read (storage without ``mget`` is read with concurrent ``get`` calls).
+
+        Args:
+            callbacks: Encoded callback_data strings
+
+        Returns:
+            The decoded MenuActions, in the same order as ``callbacks``
+
+        Raises:
+            DecodingError: If any callback fails to decode or its data is not found
+        """
+        try:
+            refs: list[tuple[int, StorageStrategy, str]] = []
+            decoded: list[dict[str, Any] | None] = []
+            for callback_data in callbacks:
+                prefix = self._match_prefix(callback_data)
+                if prefix is None:
+                    raise DecodingError(f"Unknown callback_data format: {callback_data[:10]}...")
+                strategy = self._PREFIX_STRATEGIES[prefix]
+                if strategy is StorageStrategy.INLINE:
+                    decoded.append(self._decode_inline(callback_data))
+                else:
+                    refs.append((len(decoded), strategy, callback_data[len(prefix) :]))
+                    decoded.append(None)
+
+            if refs:
+                keys = [key for _, _, key in refs]
+                if isinstance(self.storage, BaseStorage):
+                    stored = await self.storage.mget(keys)
+                else:
+                    stored = list(await asyncio.gather(*(self.storage.get(k) for k in keys)))
+                for (index, strategy, key), stored_data in zip(refs, stored, strict=True):
+                    if stored_data is None:
+                        raise self._not_found_error(strategy, key)
+                    decoded[index] = stored_data
+
+            return [
+                MenuAction(handler=data["h"], params=data.get("p", {}))
+                for data in decoded
+                if data is not None
+            ]
+
+        except Exception as e:
+            if isinstance(e, DecodingError):
+                raise
+            raise DecodingError(f"Failed to decode callback data: {e}") from e
+
+    @staticmethod
+    def _not_found_error(strategy: StorageStrategy, key: str) -> DecodingError:
+        """Build the error for a storage-backed callback whose data is missing."""
+        if strategy is StorageStrategy.SHORT:
+            return DecodingError(f"Callback data expired or not found: {key}")
+        return DecodingError(f"Callback data not found: {key}")
+
     def _encode_inline(self, data: dict[str, Any]) -> str | None:
-        """Encode data inline, preferring the most compact representation.
+        """Encode data inline, in the cheapest representation that fits.
 
-        Two inline tiers are considered and the smallest one that fits Telegram's
-        64-byte ``callback_data`` limit wins:
+        Actions without params short-circuit to ``H:<handler>`` (handler names are
+        validated to contain no ``:``), skipping serialization entirely. Otherwise
+        up to two inline tiers are tried against Telegram's 64-byte
+        ``callback_data`` limit:
 
-        - ``I:`` carries the minified, ASCII-safe JSON verbatim (no base64
+        - ``I:`` carries the minified, ASCII-safe JSON verbatim (no binary-to-text
           overhead). This is the common case for small payloads.
-        - ``IC:`` carries zlib-compressed, base64-encoded JSON. It is only used
-          when compression actually produces a shorter result than the raw JSON
-          (e.g. highly repetitive params).
+        - ``IZ:`` carries raw-DEFLATE-compressed JSON encoded with base85. It is
+          only tried when the raw tier does not fit (e.g. long, repetitive params),
+          so payloads that already fit never pay for compression.
 
         Args:
             data: Data dictionary to encode.
@@ -205,32 +351,48 @@ class CallbackEncoder:
         Returns:
             Encoded string, or ``None`` if neither tier fits within 64 bytes.
         """
-        try:
-            # Serialize to JSON with minimal separators (ASCII-safe for callback_data).
-            json_str = json.dumps(data, separators=(",", ":"), ensure_ascii=True)
-            json_bytes = json_str.encode("utf-8")
+        handler = data["h"]
+        if not data["p"] and handler.isascii() and len(handler) <= 64 - len(self.PREFIX_HANDLER):
+            return f"{self.PREFIX_HANDLER}{handler}"
 
-            candidates: list[str] = []
+        try:
+            # Serialize to JSON with minimal separators (ASCII-safe for callback_data,
+            # so character counts below equal UTF-8 byte counts).
+            json_str = _COMPACT_JSON.encode(data)
+
+            # Tier 1: raw JSON verbatim.
+            if len(json_str) <= 64 - len(self.PREFIX_INLINE):
+                return f"{self.PREFIX_INLINE}{json_str}"
+
+            # Tier 2: DEFLATE + base85 for JSON too long to carry verbatim. The budget is
+            # in UTF-8 bytes, so only ASCII symbols are free; base85 is within one byte
+            # of the densest printable-ASCII encoding at this size.
+            deflated = zlib.compress(json_str.encode("ascii"), _DEFLATE_LEVEL, _DEFLATE_WBITS)
+            b85_encoded = base64.b85encode(deflated).decode("ascii")
+            if len(b85_encoded) <= 64 - len(self.PREFIX_INLINE_COMPRESSED):
+                return f"{self.PREFIX_INLINE_COMPRESSED}{b85_encoded}"
+            return None
 
-            # Tier 1: raw JSON verbatim (no base64 overhead).
-            raw = f"{self.PREFIX_INLINE}{json_str}"
-            if len(raw.encode("utf-8")) <= 64:
-                candidates.append(raw)
+        except Exception:
+            return None
 
-            # Tier 2: zlib + base64, only worthwhile when it beats the raw JSON.
-            compressed = zlib.compress(json_bytes, level=9)
-            if len(compressed) < len(json_bytes):
-                b64_encoded = base64.b64encode(compressed).decode("ascii")
-                comp = f"{self.PREFIX_INLINE_COMPRESSED}{b64_encoded}"
-                if len(comp.encode("utf-8")) <= 64:
-                    candidates.append(comp)
+    def _match_prefix(self, callback_data: str) -> str | None:
+        """Return the strategy prefix that ``callback_data`` starts with.
 
-            if not candidates:
-                return None
-            return min(candidates, key=len)
+        Args:
+            callback_data: Encoded callback_data string
 
-        except Exception:
-            return None
+        Returns:
+            The matching key of ``_PREFIX_STRATEGIES``, or None if there is none
+        """
+        # Three-character prefixes first, so "IZ:" is never mistaken for "I:".
+        prefix = callback_data[:3]
+        if prefix in self._PREFIX_STRATEGIES:
+            return prefix
+        prefix = callback_data[:2]
+        if prefix in self._PREFIX_STRATEGIES:
+            return prefix
+        return None
 
     def _decode_inline(self, encoded: str) -> dict[str, Any]:
         """Decode inline callback data.
@@ -245,14 +407,22 @@ class CallbackEncoder:
             DecodingError: If decoding fails
         """
         try:
-            if encoded.startswith(self.PREFIX_INLINE_COMPRESSED):
-                # Compressed tier: base64 -> zlib -> JSON.
-                b64_str = encoded[len(self.PREFIX_INLINE_COMPRESSED) :]
-                decoded_bytes = zlib.decompress(base64.b64decode(b64_str))
+            prefix = self._match_prefix(encoded)
+            payload = encoded[len(prefix) :] if prefix is not None else ""
+            if prefix == self.PREFIX_INLINE_COMPRESSED:
+                # Compressed tier: base85 -> raw DEFLATE -> JSON.
+                decoded_bytes = zlib.decompress(base64.b85decode(payload), _DEFLATE_WBITS)
+                json_str = decoded_bytes.decode("utf-8")
+            elif prefix == self.PREFIX_INLINE_COMPRESSED_LEGACY:
+                # Legacy compressed tier: base64 -> zlib -> JSON.
+                decoded_bytes = zlib.decompress(base64.b64decode(payload))
                 json_str = decoded_bytes.decode("utf-8")
-            elif encoded.startswith(self.PREFIX_INLINE):
+            elif prefix == self.PREFIX_INLINE:
                 # Raw tier: the payload is the minified JSON verbatim.
-                json_str = encoded[len(self.PREFIX_INLINE) :]
+                json_str = payload
+            elif prefix == self.PREFIX_HANDLER:
+                # Parameterless action: the payload is the handler name itself.
+                return {"h": payload, "p": {}}
             else:
                 raise DecodingError("Invalid inline encoding prefix")
 
@@ -262,23 +432,27 @@ class CallbackEncoder:
         except Exception as e:
             raise DecodingError(f"Failed to decode inline data: {e}") from e
 
-    def _generate_key(self, data: dict[str, Any]) -> str:
-        """Generate deterministic key from data.
+    def _generate_key(self, canonical: bytes) -> str:
+        """Generate deterministic key from canonical JSON.
 
         This allows the same data to use the same storage key, enabling deduplication.
 
         Args:
-            data: Data dictionary
+            canonical: Canonical JSON of the data, as returned by ``_canonical_json``
 
         Returns:
             12-character hex hash
         """
-        # Serialize with sorted keys for determinism. MD5 is used purely as a
-        # fast, deterministic dedup key (not for security), so usedforsecurity is
-        # disabled to make that intent explicit and satisfy security linters.
-        json_str = json.dumps(data, sort_keys=True, separators=(",", ":"))
-        hash_obj = hashlib.md5(json_str.encode("utf-8"), usedforsecurity=False)
-        return hash_obj.hexdigest()[:12]
+        # BLAKE2b is used purely as a fast, deterministic dedup key (not for
+        # security); asking for exactly the digest size needed avoids hashing into
+        # a longer digest and truncating it.
+        key = self._key_cache.get(canonical)
+        if key is None:
+            key = hashlib.blake2b(canonical, digest_size=_KEY_DIGEST_SIZE).hexdigest()
+            if len(self._key_cache) >= _KEY_CACHE_SIZE:
+                self._key_cache.clear()
+            self._key_cache[canonical] = key
+        return key
 
     async def cleanup_callback(self, callback_data: str) -> bool:
         """Cleanup storage for a callback_data reference.
@@ -301,10 +475,115 @@ class CallbackEncoder:
             return False
 
 
+def _canonical_json(data: dict[str, Any]) -> bytes:
+    """Serialize ``data`` to compact UTF-8 JSON with sorted keys.
+
+    Uses orjson when it is installed, except for payloads containing a float: orjson
+    writes NaN and Infinity as ``null`` and formats some floats differently (``1e-7``
+    vs ``1e-07``), which would change or collide storage keys. Those, and payloads
+    orjson cannot handle (non-string dict keys, integers beyond 64 bits), go through
+    stdlib json, so keys do not depend on whether the speedup is installed.
+
+    Args:
+        data: Data dictionary to serialize.
+
+    Returns:
+        The canonical JSON bytes.
+    """
+    if _orjson is not None and not _contains_float(data):
+        try:
+            canonical: bytes = _orjson.dumps(data, option=_orjson.OPT_SORT_KEYS)
+            return canonical
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
+    return _CANONICAL_JSON.encode(data).encode()
+
+
+def _contains_float(value: object) -> bool:
+    """Tell whether ``value`` holds a float anywhere in its nested dicts, lists and tuples."""
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            return True
+        if isinstance(node, dict):
+            stack.extend(cast("Mapping[Any, Any]", node).values())
+        elif isinstance(node, list | tuple):
+            stack.extend(cast("Sequence[Any]", node))
+    return False
+
+
+def _json_length(value: Any) -> int:
+    """Return the length of ``value`` as compact, ASCII-only JSON, without serializing it.
+
+    Mirrors ``json.dumps(value, separators=(",", ":"))``: escaped characters count
+    as their escape sequence and characters outside the BMP as a surrogate pair.
+
+    Args:
+        value: A JSON-serializable value.
+
+    Returns:
+        The number of bytes ``json.dumps`` would produce.
+    """
+    if isinstance(value, str):
+        return _json_str_length(value)
+    if value is None or isinstance(value, bool):
+        return 5 if value is False else 4
+    if isinstance(value, dict):
+        mapping = cast("Mapping[Any, Any]", value)
+        # Braces, a colon per pair and commas between pairs.
+        size = 2 + 2 * len(mapping) - 1 if mapping else 2
+        for key, item in mapping.items():
+            # Non-string keys are written as their JSON scalar text in quotes.
+            key_size = _json_length(key) if isinstance(key, str) else 2 + _json_length(key)
+            size += key_size + _json_length(item)
+        return size
+    if isinstance(value, list | tuple):
+        sequence = cast("Sequence[Any]", value)
+        size = 2 + len(sequence) - 1 if sequence else 2
+        for item in sequence:
+            size += _json_length(item)
+        return size
+    if isinstance(value, int | float):
+        return _json_number_length(value)
+    return len(repr(value))
+
+
+def _json_str_length(value: str) -> int:
+    """Return the length of ``value`` as an ASCII-only JSON string literal."""
+    if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+        return len(value) + 2
+    return 2 + sum(_json_char_length(char) for char in value)
+
+
+def _json_number_length(value: float) -> int:
+    """Return the length of the JSON text ``json.dumps`` writes for a number."""
+    if isinstance(value, int):
+        return len(int.__repr__(value))
+    if math.isnan(value):
+        return 3  # NaN
+    if math.isinf(value):
+        return 8 if value > 0 else 9  # Infinity / -Infinity
+    return len(float.__repr__(value))
+
+
+def _json_char_length(char: str) -> int:
+    """Return the length of ``char`` inside an ASCII-only JSON string literal."""
+    if " " <= char <= "~":
+        return 2 if char in '"\\' else 1
+    if char in "\n\r\t\b\f":
+        return 2
+    # \uXXXX, or a surrogate pair of two for characters outside the BMP.
+    return 12 if char > "\uffff" else 6
+
+
 def estimate_encoded_size(action: MenuAction) -> int:
     """Estimate the size of encoded callback data.
 
-    This is useful for determining storage strategy before encoding.
+    This is useful for determining storage strategy before encoding. The JSON
+    length is computed from the handler and params directly, so no JSON string is
+    built. Payloads the encoder carries verbatim (``H:`` and ``I:``) get their
+    exact size; larger ones get a compressed-size approximation.
 
     Args:
         action: MenuAction to estimate
@@ -317,20 +596,24 @@ def estimate_encoded_size(action: MenuAction) -> int:
         >>> size = estimate_encoded_size(action)
         >>> print(f"Estimated size: {size} bytes")
     """
-    data = {
-        "h": action.handler,
-        "p": action.params,
-    }
-
-    json_str = json.dumps(data, separators=(",", ":"))
-    json_bytes = json_str.encode("utf-8")
+    handler = action.handler
+    handler_size = len(CallbackEncoder.PREFIX_HANDLER) + len(handler)
+    # Same guard as the encoder's H: shortcut; longer handlers take the I:/IZ: path.
+    if not action.params and handler.isascii() and handler_size <= 64:
+        return handler_size
+
+    # {"h":<handler>,"p":<params>} is 11 bytes of scaffolding around the values.
+    json_size = 11 + _json_length(handler) + _json_length(action.params)
+    raw_size = len(CallbackEncoder.PREFIX_INLINE) + json_size
+    if raw_size <= 64:
+        return raw_size
 
     # Estimate compressed size (rough approximation)
     # Real compression ratio varies, but this gives a reasonable estimate
-    estimated_compressed = len(json_bytes) * 0.7  # Assume 30% compression
+    estimated_compressed = json_size * 0.7  # Assume 30% compression
 
-    # Base64 adds ~33% overhead
-    estimated_b64 = estimated_compressed * 1.33
+    # Base85 adds 25% overhead
+    estimated_b85 = estimated_compressed * 1.25
 
     # Add prefix (2-3 bytes)
-    return int(estimated_b64 + 3)
+    return int(estimated_b85 + 3)
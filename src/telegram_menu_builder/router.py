@@ -4,8 +4,12 @@ This module provides a routing system that dispatches callback queries to
 registered handler functions based on the decoded callback data.
 """
 
+import asyncio
 import datetime
 import logging
+import sys
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
@@ -22,6 +26,38 @@ logger = logging.getLogger(__name__)
 # Type alias for handler functions
 HandlerFunc = Callable[[Update, ContextTypes.DEFAULT_TYPE, dict[str, Any]], Awaitable[None]]
 
+# A compiled middleware chain: runs before -> handler -> after, False if handler is None
+_Pipeline = Callable[
+    [Update, ContextTypes.DEFAULT_TYPE, dict[str, Any], HandlerFunc | None], Awaitable[bool]
+]
+
+# How long (seconds) a failed decode is remembered, capped at the router's decode_cache_ttl.
+_NEGATIVE_DECODE_TTL = 10.0
+# At most this many failed decodes are remembered (capped at decode_cache_size), in an LRU
+# of their own so a flood of distinct bogus callbacks cannot evict valid entries.
+_NEGATIVE_DECODE_CACHE_SIZE = 512
+
+# Callback prefixes whose decode reads storage, and so may be worth hedging.
+_STORAGE_PREFIXES = (CallbackEncoder.PREFIX_SHORT, CallbackEncoder.PREFIX_PERSISTENT)
+
+
+def _is_definite_decode_failure(callback_data: str, error: DecodingError) -> bool:
+    """Tell whether a decode failure will certainly repeat, so it may be cached.
+
+    Inline callbacks never touch storage, so their failures are definite. A
+    storage-backed callback fails definitively only when its data is missing; a
+    wrapped backend exception (``__cause__`` set) may be a transient outage.
+    """
+    return error.__cause__ is None or not callback_data.startswith(_STORAGE_PREFIXES)
+
+
+def _lru_insert[V](cache: OrderedDict[str, V], max_size: int, key: str, value: V) -> None:
+    """Insert ``value`` as the most recent entry, evicting the least recently used when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
 
 class MenuRouter:
     """Router for dispatching callback queries to handlers.
@@ -47,11 +83,38 @@ class MenuRouter:
         >>> app.add_handler(CallbackQueryHandler(router.route))
     """
 
+    __slots__ = (
+        "_after_handlers",
+        "_auto_answer",
+        "_before_handlers",
+        "_concurrent_middleware",
+        "_decode_cache",
+        "_decode_cache_size",
+        "_decode_cache_ttl",
+        "_decode_errors",
+        "_default_handler",
+        "_eager_answer",
+        "_encoder",
+        "_error_handlers",
+        "_handlers",
+        "_hedge_after",
+        "_inflight",
+        "_inflight_followers",
+        "_pipeline",
+        "_storage",
+    )
+
     def __init__(
         self,
         storage: StorageBackend | None = None,
         default_handler: HandlerFunc | None = None,
         auto_answer: bool = True,
+        *,
+        decode_cache_size: int = 0,
+        decode_cache_ttl: float = 60.0,
+        eager_answer: bool = False,
+        concurrent_middleware: bool = False,
+        hedge_after: float | None = None,
     ) -> None:
         """Initialize menu router.
 
@@ -59,19 +122,56 @@ class MenuRouter:
             storage: Storage backend (defaults to MemoryStorage)
             default_handler: Optional fallback handler for unknown actions
             auto_answer: Automatically answer callback queries
+            decode_cache_size: Maximum number of decoded callbacks kept in memory so
+                repeated presses of the same button skip the storage lookup. ``0``
+                (the default) disables the cache
+            decode_cache_ttl: Seconds a decoded callback stays cached (and keeps
+                dispatching after its storage entry is deleted); malformed or
+                missing callbacks are cached for at most 10 seconds
+            eager_answer: With ``auto_answer``, answer the query concurrently with
+                the handler instead of after it returns. The answer is sent before
+                the outcome is known, so a failing handler no longer gets the
+                ``"An error occurred"`` answer
+            concurrent_middleware: Run the ``before``, ``after`` and ``on_error``
+                middleware of each stage concurrently (``asyncio.gather``) instead of
+                one after another. Only enable this for independent middleware
+                that does not rely on registration order
+            hedge_after: Seconds to wait for a storage-backed decode before issuing
+                a second, identical lookup and using whichever succeeds first.
+                Bounds the tail latency of a slow backend (e.g. a Redis or SQL
+                replica hiccup) at the cost of an extra read. ``None`` (the
+                default) never hedges; inline callbacks are never hedged
         """
         self._storage = storage or MemoryStorage()
         self._encoder = CallbackEncoder(self._storage)
         self._handlers: dict[str, HandlerFunc] = {}
         self._default_handler = default_handler
         self._auto_answer = auto_answer
+        self._eager_answer = eager_answer
+        self._concurrent_middleware = concurrent_middleware
+        self._hedge_after = hedge_after
+
+        # L1 decode cache: callback_data -> (expiry, action)
+        self._decode_cache: OrderedDict[str, tuple[float, MenuAction]] = OrderedDict()
+        self._decode_cache_size = decode_cache_size
+        self._decode_cache_ttl = decode_cache_ttl
+        # Negative cache: callback_data -> (expiry, decode error message)
+        self._decode_errors: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Decodes currently awaiting storage, shared by concurrent presses of one button,
+        # and how many presses are waiting on each
+        self._inflight: dict[str, asyncio.Future[MenuAction]] = {}
+        self._inflight_followers: dict[str, int] = {}
 
         # Middleware hooks
         self._before_handlers: list[HandlerFunc] = []
         self._after_handlers: list[HandlerFunc] = []
-        self._error_handlers: list[
-            Callable[[Update, ContextTypes.DEFAULT_TYPE, Exception], Awaitable[None]]
-        ] = []
+        # Error handlers are read as-is on every routing error, so they are kept as an
+        # immutable tuple (re-created on registration) rather than a list.
+        self._error_handlers: tuple[
+            Callable[[Update, ContextTypes.DEFAULT_TYPE, Exception], Awaitable[None]], ...
+        ] = ()
+        # Compiled from the middleware lists on first use; reset when they change
+        self._pipeline: _Pipeline | None = None
 
     def handler(self, name: str) -> Callable[[HandlerFunc], HandlerFunc]:
         """Decorator to register a handler function.
@@ -107,8 +207,11 @@ class MenuRouter:
             ...     pass
             >>> router.register_handler("my_action", my_handler)
         """
+        # Handler names form a small, long-lived set; interning shares one string
+        # object per name across registrations and encoded actions.
+        name = sys.intern(name)
         if name in self._handlers:
-            logger.warning(f"Overwriting existing handler for '{name}'")
+            logger.warning("Overwriting existing handler for '%s'", name)
 
         self._handlers[name] = func
 
@@ -175,21 +278,195 @@ class MenuRouter:
                 await callback_query.answer()
             return
 
+        auto_answer = self._auto_answer
+        answer_task: asyncio.Task[bool] | None = None
         try:
-            action = await self._encoder.decode(callback_data)
-            handled = await self._dispatch(update, context, callback_query, action)
-            if handled and self._auto_answer:
+            action = await self._decode(callback_data)
+            handler = self._resolve_handler(action.handler)
+            if handler is not None and auto_answer and self._eager_answer:
+                # The answer does not depend on the handler; overlap the round-trips.
+                answer_task = asyncio.create_task(callback_query.answer())
+            handled = await self._dispatch(update, context, callback_query, action, handler)
+            if handled and auto_answer and answer_task is None:
                 await callback_query.answer()
-        except DecodingError as e:
-            logger.error(f"Failed to decode callback data: {e}")
-            await self._handle_routing_error(
-                update, context, callback_query, e, "Invalid or expired action"
-            )
         except Exception as e:
-            logger.exception(f"Error handling callback query: {e}")
             await self._handle_routing_error(
-                update, context, callback_query, e, "An error occurred"
+                update, context, callback_query, e, answered=answer_task is not None
             )
+        finally:
+            if answer_task is not None:
+                try:
+                    await answer_task
+                except Exception as e:
+                    logger.error("Failed to answer callback query: %s", e)
+
+    def _resolve_handler(self, handler_name: str) -> HandlerFunc | None:
+        """Return the handler registered for ``handler_name``, else the default one.
+
+        Args:
+            handler_name: The decoded action's handler name.
+
+        Returns:
+            The handler to run, or None if neither exists.
+        """
+        handler = self._handlers.get(handler_name)
+        if handler is None and self._default_handler is not None:
+            logger.debug("Handler '%s' not found, using default handler", handler_name)
+            return self._default_handler
+        return handler
+
+    async def _decode(self, callback_data: str) -> MenuAction:
+        """Decode callback data through the in-process LRU cache.
+
+        Hits are served without touching storage. Each hit returns a deep copy, so
+        a handler mutating its ``params`` cannot affect later presses. Definite
+        decoding failures (malformed payloads, or storage data that is missing) are
+        cached briefly in a separate, smaller LRU and re-raised as a fresh
+        :class:`DecodingError`; storage errors are never cached. Misses go through
+        :meth:`_decode_single_flight`, so concurrent presses share one lookup.
+        Without the cache, a decode that no other press shared is returned as is.
+
+        Args:
+            callback_data: Raw callback data from the query.
+
+        Returns:
+            The decoded MenuAction.
+
+        Raises:
+            DecodingError: If the callback data cannot be decoded.
+        """
+        if self._decode_cache_size <= 0:
+            action, shared = await self._decode_single_flight(callback_data)
+            return action.model_copy(deep=True) if shared else action
+
+        cache = self._decode_cache
+        errors = self._decode_errors
+        now = time.monotonic()
+        entry = cache.get(callback_data)
+        if entry is not None:
+            expiry, action = entry
+            if now < expiry:
+                cache.move_to_end(callback_data)
+                return action.model_copy(deep=True)
+            del cache[callback_data]
+        if errors:
+            error_entry = errors.get(callback_data)
+            if error_entry is not None:
+                expiry, message = error_entry
+                if now < expiry:
+                    raise DecodingError(message)
+                del errors[callback_data]
+
+        try:
+            action, _ = await self._decode_single_flight(callback_data)
+        except DecodingError as e:
+            if _is_definite_decode_failure(callback_data, e):
+                ttl = min(_NEGATIVE_DECODE_TTL, self._decode_cache_ttl)
+                _lru_insert(
+                    errors,
+                    min(_NEGATIVE_DECODE_CACHE_SIZE, self._decode_cache_size),
+                    callback_data,
+                    (now + ttl, str(e)),
+                )
+            raise
+
+        _lru_insert(
+            cache, self._decode_cache_size, callback_data, (now + self._decode_cache_ttl, action)
+        )
+        return action.model_copy(deep=True)
+
+    async def _decode_single_flight(self, callback_data: str) -> tuple[MenuAction, bool]:
+        """Decode callback data, sharing one in-flight decode per callback.
+
+        The first caller decodes and publishes the outcome on a future; callers
+        arriving while it is pending await that future instead of issuing their
+        own storage lookup. If the leading caller is cancelled, its followers do
+        not inherit the cancellation: they retry, and the first becomes the new
+        leader. A leader nobody joined gets its freshly decoded action to itself;
+        otherwise the action is shared, and callers must copy it before handing it
+        out.
+
+        Args:
+            callback_data: Raw callback data from the query.
+
+        Returns:
+            The decoded MenuAction, and whether it is shared with other callers.
+
+        Raises:
+            DecodingError: If the callback data cannot be decoded.
+        """
+        while (inflight := self._inflight.get(callback_data)) is not None:
+            followers = self._inflight_followers
+            followers[callback_data] = followers.get(callback_data, 0) + 1
+            try:
+                # Shielded: a cancelled follower must not cancel the shared decode.
+                return await asyncio.shield(inflight), True
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # Only the leader was cancelled: retry instead of dropping this update.
+
+        future: asyncio.Future[MenuAction] = asyncio.get_running_loop().create_future()
+        self._inflight[callback_data] = future
+        try:
+            action = await self._decode_hedged(callback_data)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved by the raise below; don't log it as unhandled
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[callback_data]
+            shared = self._inflight_followers.pop(callback_data, 0) > 0
+
+        future.set_result(action)
+        return action, shared
+
+    async def _decode_hedged(self, callback_data: str) -> MenuAction:
+        """Decode callback data, hedging a slow storage lookup with a second one.
+
+        Without ``hedge_after`` (or for inline callbacks, which never touch
+        storage) this is a plain decode. Otherwise, if the first decode has not
+        finished after ``hedge_after`` seconds, an identical one is started and the
+        first to succeed wins; the other is cancelled. Only if both fail is the
+        error raised.
+
+        Args:
+            callback_data: Raw callback data from the query.
+
+        Returns:
+            The decoded MenuAction.
+
+        Raises:
+            DecodingError: If the callback data cannot be decoded.
+        """
+        decode = self._encoder.decode
+        hedge_after = self._hedge_after
+        if hedge_after is None or not callback_data.startswith(_STORAGE_PREFIXES):
+            return await decode(callback_data)
+
+        tasks = [asyncio.ensure_future(decode(callback_data))]
+        failed: asyncio.Future[MenuAction] | None = None
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                tasks.append(asyncio.ensure_future(decode(callback_data)))
+                pending = set(tasks)
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failed = task
+                if not pending and failed is not None:
+                    # Every attempt failed: surface the last failure.
+                    return failed.result()
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _dispatch(
         self,
@@ -197,6 +474,7 @@ class MenuRouter:
         context: ContextTypes.DEFAULT_TYPE,
         callback_query: CallbackQuery,
         action: MenuAction,
+        handler: HandlerFunc | None,
     ) -> bool:
         """Run middleware and execute the handler for a decoded action.
 
@@ -205,6 +483,7 @@ class MenuRouter:
             context: Telegram Context object.
             callback_query: The update's callback query (already validated).
             action: The decoded MenuAction.
+            handler: The handler from :meth:`_resolve_handler` (None if not found).
 
         Returns:
             True if a handler (or the default handler) ran, False if no handler
@@ -213,31 +492,87 @@ class MenuRouter:
         params = action.params
         handler_name = action.handler
 
-        logger.debug(f"Routing to handler '{handler_name}' with params: {params}")
+        # Guarded so the params repr (potentially large) is skipped above DEBUG.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Routing to handler '%s' with params: %s", handler_name, params)
 
-        # Run before middleware
-        for before_handler in self._before_handlers:
-            await before_handler(update, context, params)
+        pipeline = self._pipeline
+        if pipeline is None:
+            pipeline = self._pipeline = self._compile_pipeline()
 
-        # Find and execute handler
-        handler = self._handlers.get(handler_name)
+        if await pipeline(update, context, params, handler):
+            return True
 
-        if handler:
-            await handler(update, context, params)
-        elif self._default_handler:
-            logger.debug(f"Handler '{handler_name}' not found, using default handler")
-            await self._default_handler(update, context, params)
-        else:
-            logger.warning(f"No handler registered for '{handler_name}' and no default handler")
-            if self._auto_answer:
-                await callback_query.answer("Action not available")
-            return False
+        logger.warning("No handler registered for '%s' and no default handler", handler_name)
+        if self._auto_answer:
+            await callback_query.answer("Action not available")
+        return False
 
-        # Run after middleware
-        for after_handler in self._after_handlers:
-            await after_handler(update, context, params)
+    def _compile_pipeline(self) -> _Pipeline:
+        """Compile the before/after middleware into a single coroutine function.
 
-        return True
+        The middleware lists are snapshotted into tuples captured by the closure,
+        so routing runs one call without re-reading them from ``self``. Without
+        any middleware the handler is awaited directly; with
+        ``concurrent_middleware`` each stage is awaited as one ``asyncio.gather``.
+
+        Returns:
+            A coroutine function running before middleware, the handler (if any)
+            and after middleware, and returning whether a handler ran.
+        """
+        befores = tuple(self._before_handlers)
+        afters = tuple(self._after_handlers)
+
+        if not befores and not afters:
+
+            async def run_handler(
+                update: Update,
+                context: ContextTypes.DEFAULT_TYPE,
+                params: dict[str, Any],
+                handler: HandlerFunc | None,
+            ) -> bool:
+                if handler is None:
+                    return False
+                await handler(update, context, params)
+                return True
+
+            return run_handler
+
+        if self._concurrent_middleware:
+
+            async def run_gathered(
+                update: Update,
+                context: ContextTypes.DEFAULT_TYPE,
+                params: dict[str, Any],
+                handler: HandlerFunc | None,
+            ) -> bool:
+                if befores:
+                    await asyncio.gather(*(before(update, context, params) for before in befores))
+                if handler is None:
+                    return False
+                await handler(update, context, params)
+                if afters:
+                    await asyncio.gather(*(after(update, context, params) for after in afters))
+                return True
+
+            return run_gathered
+
+        async def run_chain(
+            update: Update,
+            context: ContextTypes.DEFAULT_TYPE,
+            params: dict[str, Any],
+            handler: HandlerFunc | None,
+        ) -> bool:
+            for before_handler in befores:
+                await before_handler(update, context, params)
+            if handler is None:
+                return False
+            await handler(update, context, params)
+            for after_handler in afters:
+                await after_handler(update, context, params)
+            return True
+
+        return run_chain
 
     async def _handle_routing_error(
         self,
@@ -245,21 +580,38 @@ class MenuRouter:
         context: ContextTypes.DEFAULT_TYPE,
         callback_query: CallbackQuery,
         error: Exception,
-        answer_text: str,
+        *,
+        answered: bool = False,
     ) -> None:
-        """Run registered error handlers and optionally answer the callback query.
+        """Log a routing error, run error handlers and optionally answer the query.
+
+        Must be called from the ``except`` block handling ``error``, so that
+        unexpected errors are logged with their traceback.
 
         Args:
             update: Telegram Update object.
             context: Telegram Context object.
             callback_query: The update's callback query (already validated).
             error: The exception that occurred during routing.
-            answer_text: Text to show the user when auto-answering.
+            answered: True if the query was already answered (``eager_answer``).
         """
-        for error_handler in self._error_handlers:
-            await error_handler(update, context, error)
+        if isinstance(error, DecodingError):
+            logger.error("Failed to decode callback data: %s", error)
+            answer_text = "Invalid or expired action"
+        else:
+            logger.exception("Error handling callback query: %s", error)
+            answer_text = "An error occurred"
 
-        if self._auto_answer:
+        error_handlers = self._error_handlers
+        if error_handlers and self._concurrent_middleware:
+            await asyncio.gather(
+                *(error_handler(update, context, error) for error_handler in error_handlers)
+            )
+        else:
+            for error_handler in error_handlers:
+                await error_handler(update, context, error)
+
+        if self._auto_answer and not answered:
             await callback_query.answer(answer_text)
 
     def before(self, func: HandlerFunc) -> HandlerFunc:
@@ -279,6 +631,7 @@ class MenuRouter:
             ...     logger.info(f"Callback received: {params}")
         """
         self._before_handlers.append(func)
+        self._pipeline = None
         return func
 
     def after(self, func: HandlerFunc) -> HandlerFunc:
@@ -299,6 +652,7 @@ class MenuRouter:
             ...     pass
         """
         self._after_handlers.append(func)
+        self._pipeline = None
         return func
 
     def on_error(
@@ -320,9 +674,27 @@ class MenuRouter:
             ...     logger.error(f"Error: {error}")
             ...     await update.callback_query.answer("Something went wrong")
         """
-        self._error_handlers.append(func)
+        self._error_handlers = (*self._error_handlers, func)
         return func
 
+    def remove_error_handler(
+        self, func: Callable[[Update, ContextTypes.DEFAULT_TYPE, Exception], Awaitable[None]]
+    ) -> bool:
+        """Remove an error handler registered with :meth:`on_error`.
+
+        Args:
+            func: The error handler to remove
+
+        Returns:
+            True if the handler was removed, False if it was not registered
+        """
+        handlers = self._error_handlers
+        if func not in handlers:
+            return False
+        index = handlers.index(func)
+        self._error_handlers = handlers[:index] + handlers[index + 1 :]
+        return True
+
     def get_handler(self, name: str) -> HandlerFunc | None:
         """Get a registered handler by name.
 
@@ -425,6 +797,7 @@ class RouterGroup:
         """
         self.prefix = prefix
         self.router = router
+        self._prefix_dot = sys.intern(prefix + ".")
 
     def handler(self, name: str) -> Callable[[HandlerFunc], HandlerFunc]:
         """Decorator to register a handler with prefix.
@@ -435,8 +808,7 @@ class RouterGroup:
         Returns:
             Decorator function
         """
-        full_name = f"{self.prefix}.{name}"
-        return self.router.handler(full_name)
+        return self.router.handler(self._prefix_dot + name)
 
     def register_handler(self, name: str, func: HandlerFunc) -> None:
         """Register a handler with prefix.
@@ -445,5 +817,16 @@ class RouterGroup:
             name: Handler name (will be prefixed)
             func: Async handler function
         """
-        full_name = f"{self.prefix}.{name}"
-        self.router.register_handler(full_name, func)
+        self.router.register_handler(self._prefix_dot + name, func)
+
+    def register_handlers(self, handlers: Mapping[str, HandlerFunc]) -> None:
+        """Register multiple handlers with prefix.
+
+        Args:
+            handlers: Mapping of handler names (will be prefixed) to functions
+
+        Example:
+            >>> users.register_handlers({"edit": edit_user, "delete": delete_user})
+        """
+        prefix_dot = self._prefix_dot
+        self.router.register_handlers({prefix_dot + name: func for name, func in handlers.items()})
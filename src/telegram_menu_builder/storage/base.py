@@ -4,7 +4,9 @@ This module defines the protocol that all storage backends must implement,
 allowing for pluggable storage strategies (memory, Redis, SQL, etc.).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -15,6 +17,10 @@ class StorageBackend(Protocol):
     All storage implementations must provide these methods to be compatible
     with the menu builder system.
 
+    The protocol is ``runtime_checkable`` so callers can validate a backend with
+    ``isinstance``. That check looks up every protocol method on each call, which
+    is why the library never performs it on a hot path; do it once at startup.
+
     Example:
         >>> class MyStorage:
         ...     async def set(self, key: str, data: dict[str, Any], ttl: int | None = None) -> None:
@@ -138,6 +144,8 @@ class BaseStorage(ABC):
     Subclasses only need to implement the abstract methods.
     """
 
+    __slots__ = ("_closed",)
+
     def __init__(self) -> None:
         """Initialize storage backend."""
         self._closed = False
@@ -198,6 +206,58 @@ class BaseStorage(ABC):
     async def keys(self, pattern: str | None = None) -> list[str]:
         """Get all keys, optionally filtered by pattern."""
 
+    async def mget(self, keys: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Retrieve several keys at once.
+
+        The default issues the :meth:`get` calls concurrently; backends with a
+        native batch read (e.g. Redis ``MGET``) should override it to make the
+        whole batch a single round-trip.
+
+        Args:
+            keys: Keys to retrieve
+
+        Returns:
+            One entry per key, in order: the stored dictionary, or None if
+            missing/expired
+
+        Raises:
+            StorageError: If retrieval fails
+        """
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def mset(self, items: Mapping[str, dict[str, Any]], ttl: int | None = None) -> None:
+        """Store several keys at once, all with the same TTL.
+
+        The default issues the :meth:`set` calls concurrently; override it when
+        the backend can write a batch in one round-trip.
+
+        Args:
+            items: Mapping of keys to the dictionaries to store
+            ttl: Time-to-live in seconds for every key (None = no expiration)
+
+        Raises:
+            StorageError: If storage operation fails
+        """
+        await asyncio.gather(*(self.set(key, data, ttl) for key, data in items.items()))
+
+    async def mdelete(self, keys: Sequence[str]) -> int:
+        """Delete several keys at once.
+
+        The default issues the :meth:`delete` calls concurrently; override it
+        when the backend can delete a batch in one round-trip.
+
+        Args:
+            keys: Keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted
+
+        Raises:
+            StorageError: If deletion fails
+        """
+        deleted = await asyncio.gather(*(self.delete(key) for key in keys))
+        return sum(deleted)
+
     async def close(self) -> None:
         """Close storage backend and cleanup resources.
 
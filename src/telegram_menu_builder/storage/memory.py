@@ -5,11 +5,25 @@ and applications that don't require persistent storage across restarts.
 """
 
 import fnmatch
+import functools
+import heapq
+import re
 import time
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from telegram_menu_builder.storage.base import BaseStorage
 
+# TTLs are tracked on the monotonic clock, which never jumps on wall-clock (NTP)
+# corrections; the alias saves an attribute lookup on every read.
+_now = time.monotonic
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern to a regex once, for reuse across keys and calls."""
+    return re.compile(fnmatch.translate(pattern))
+
 
 class MemoryStorage(BaseStorage):
     """In-memory storage backend using Python dictionaries.
@@ -19,7 +33,10 @@ class MemoryStorage(BaseStorage):
 
     Attributes:
         _data: Internal dictionary storing the data
-        _expiry: Dictionary mapping keys to expiration timestamps
+        _expiry: Dictionary mapping keys to expiration timestamps (monotonic clock)
+        _expiry_heap: Min-heap of ``(timestamp, key)`` used to find expired keys
+            without scanning ``_expiry``; entries whose timestamp no longer matches
+            ``_expiry`` are stale and skipped
 
     Example:
         >>> storage = MemoryStorage()
@@ -28,16 +45,24 @@ class MemoryStorage(BaseStorage):
         >>> print(data)
         {'value': 123}
 
+    Isolation:
+        ``set()``/``add()`` store a shallow copy of the given dict and ``get()``
+        returns a shallow copy, so callers may mutate the top level of either
+        freely. Nested containers are shared and must not be mutated.
+
     Thread Safety:
         This implementation is NOT thread-safe. If you need concurrent access,
         consider using locks or a thread-safe storage backend.
     """
 
+    __slots__ = ("_data", "_expiry", "_expiry_heap")
+
     def __init__(self) -> None:
         """Initialize in-memory storage."""
         super().__init__()
         self._data: dict[str, dict[str, Any]] = {}
         self._expiry: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
 
     async def set(self, key: str, data: dict[str, Any], ttl: int | None = None) -> None:
         """Store data in memory with optional TTL.
@@ -53,12 +78,7 @@ class MemoryStorage(BaseStorage):
         self._ensure_open()
 
         self._data[key] = data.copy()  # Store a copy to prevent external modifications
-
-        if ttl is not None:
-            self._expiry[key] = time.time() + ttl
-        elif key in self._expiry:
-            # Remove expiry if it existed before
-            del self._expiry[key]
+        self._set_expiry(key, ttl)
 
     async def add(self, key: str, data: dict[str, Any], ttl: int | None = None) -> bool:
         """Atomically store data only if the key is absent (set-if-absent).
@@ -83,16 +103,15 @@ class MemoryStorage(BaseStorage):
         self._ensure_open()
 
         # A live (present and not-yet-expired) value blocks the claim.
-        if key in self._data and not (key in self._expiry and time.time() > self._expiry[key]):
+        expiry_map = self._expiry
+        expiry = expiry_map.get(key) if expiry_map else None
+        if key in self._data and not (expiry is not None and _now() > expiry):
             return False
 
         # Absent or expired: claim it. No await between the check and the store,
         # so a concurrent add() cannot interleave under a single event loop.
         self._data[key] = data.copy()
-        if ttl is not None:
-            self._expiry[key] = time.time() + ttl
-        elif key in self._expiry:
-            del self._expiry[key]
+        self._set_expiry(key, ttl)
         return True
 
     async def get(self, key: str) -> dict[str, Any] | None:
@@ -109,18 +128,93 @@ class MemoryStorage(BaseStorage):
         """
         self._ensure_open()
 
-        # Check if key exists
-        if key not in self._data:
+        # One lookup per dict: this is the hot path of every storage-backed decode.
+        data = self._data.get(key)
+        if data is None:
             return None
 
-        # Check if expired
-        if key in self._expiry and time.time() > self._expiry[key]:
+        # Check if expired (skipped outright while no key has a TTL)
+        expiry_map = self._expiry
+        expiry = expiry_map.get(key) if expiry_map else None
+        if expiry is not None and _now() > expiry:
             # Expired - clean up and return None
             await self.delete(key)
             return None
 
         # Return a copy to prevent external modifications
-        return self._data[key].copy()
+        return data.copy()
+
+    async def mget(self, keys: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Retrieve several keys in one pass, with a single clock reading.
+
+        Args:
+            keys: Keys to retrieve
+
+        Returns:
+            One entry per key, in order: a copy of the stored dictionary, or None
+            if missing/expired
+
+        Raises:
+            RuntimeError: If storage is closed
+        """
+        self._ensure_open()
+
+        data_map = self._data
+        expiry_map = self._expiry
+        if not expiry_map:
+            # No key has a TTL, so nothing can be expired.
+            return [
+                data.copy() if (data := data_map.get(key)) is not None else None for key in keys
+            ]
+
+        now = _now()
+        results: list[dict[str, Any] | None] = []
+        for key in keys:
+            data = data_map.get(key)
+            expiry = expiry_map.get(key)
+            if data is None or (expiry is not None and now > expiry):
+                # Expired entries are left for the heap-driven purge.
+                results.append(None)
+            else:
+                results.append(data.copy())
+        return results
+
+    async def mset(self, items: Mapping[str, dict[str, Any]], ttl: int | None = None) -> None:
+        """Store several keys at once, all with the same TTL.
+
+        Args:
+            items: Mapping of keys to the dictionaries to store
+            ttl: Time-to-live in seconds for every key (None = no expiration)
+
+        Raises:
+            RuntimeError: If storage is closed
+        """
+        self._ensure_open()
+
+        for key, data in items.items():
+            self._data[key] = data.copy()
+            self._set_expiry(key, ttl)
+
+    async def mdelete(self, keys: Sequence[str]) -> int:
+        """Delete several keys at once.
+
+        Args:
+            keys: Keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted
+
+        Raises:
+            RuntimeError: If storage is closed
+        """
+        self._ensure_open()
+
+        deleted = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None:
+                deleted += 1
+            self._expiry.pop(key, None)
+        return deleted
 
     async def delete(self, key: str) -> bool:
         """Delete data from memory.
@@ -136,14 +230,8 @@ class MemoryStorage(BaseStorage):
         """
         self._ensure_open()
 
-        existed = key in self._data
-
-        if key in self._data:
-            del self._data[key]
-
-        if key in self._expiry:
-            del self._expiry[key]
-
+        existed = self._data.pop(key, None) is not None
+        self._expiry.pop(key, None)
         return existed
 
     async def exists(self, key: str) -> bool:
@@ -163,8 +251,10 @@ class MemoryStorage(BaseStorage):
         if key not in self._data:
             return False
 
-        # Check expiration
-        if key in self._expiry and time.time() > self._expiry[key]:
+        # Check expiration (skipped outright while no key has a TTL)
+        expiry_map = self._expiry
+        expiry = expiry_map.get(key) if expiry_map else None
+        if expiry is not None and _now() > expiry:
             # Expired - clean up
             await self.delete(key)
             return False
@@ -181,6 +271,7 @@ class MemoryStorage(BaseStorage):
 
         self._data.clear()
         self._expiry.clear()
+        self._expiry_heap.clear()
 
     async def keys(self, pattern: str | None = None) -> list[str]:
         """Get all keys from memory, optionally filtered by pattern.
@@ -197,21 +288,15 @@ class MemoryStorage(BaseStorage):
         self._ensure_open()
 
         # Clean up expired keys first
-        current_time = time.time()
-        expired_keys = [key for key, expiry in self._expiry.items() if current_time > expiry]
-
-        for key in expired_keys:
-            await self.delete(key)
-
-        # Get all valid keys
-        all_keys = list(self._data.keys())
+        self._purge_expired()
 
         # Filter by pattern if provided
         if pattern is None:
-            return all_keys
+            return list(self._data)
 
-        # Simple glob pattern matching
-        return [key for key in all_keys if fnmatch.fnmatch(key, pattern)]
+        # Simple glob pattern matching (case-sensitive, like fnmatch.fnmatchcase)
+        match = _compile_glob(pattern).match
+        return [key for key in self._data if match(key)]
 
     async def cleanup_expired(self) -> int:
         """Manually cleanup expired entries.
@@ -226,13 +311,62 @@ class MemoryStorage(BaseStorage):
         """
         self._ensure_open()
 
-        current_time = time.time()
-        expired_keys = [key for key, expiry in self._expiry.items() if current_time > expiry]
+        return self._purge_expired()
 
-        for key in expired_keys:
-            await self.delete(key)
+    def _set_expiry(self, key: str, ttl: int | None) -> None:
+        """Record (or clear) the expiration timestamp for ``key``.
+
+        The previous heap entry for the key, if any, is left in place and skipped
+        later as stale. The heap is rebuilt once stale entries outnumber live ones.
+
+        Args:
+            key: The key just stored
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        if ttl is not None:
+            expiry = _now() + ttl
+            self._expiry[key] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, key))
+        elif key in self._expiry:
+            # Remove expiry if it existed before
+            del self._expiry[key]
+
+        if len(self._expiry_heap) > 2 * len(self._expiry):
+            self._expiry_heap = [(expiry, key) for key, expiry in self._expiry.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _purge_expired(self) -> int:
+        """Delete every expired key, popping only the expired heap entries.
 
-        return len(expired_keys)
+        When more than a quarter of all keys expired at once (e.g. after a burst),
+        the dicts are rebuilt with comprehensions instead of deleting key by key:
+        CPython dicts never shrink on ``del``, so rebuilding also releases the
+        table space the expired entries occupied.
+
+        Returns:
+            Number of expired entries removed
+        """
+        current_time = _now()
+        heap = self._expiry_heap
+        expiry_map = self._expiry
+        expired: list[str] = []
+
+        while heap and current_time > heap[0][0]:
+            expiry, key = heapq.heappop(heap)
+            # Skip stale entries: the key was deleted or re-set with another TTL.
+            if expiry_map.get(key) == expiry:
+                del expiry_map[key]
+                expired.append(key)
+
+        if len(expired) > len(self._data) // 4:
+            expired_set = set(expired)
+            self._data = {k: v for k, v in self._data.items() if k not in expired_set}
+            self._expiry = dict(expiry_map)
+        else:
+            for key in expired:
+                del self._data[key]
+
+        return len(expired)
 
     def get_stats(self) -> dict[str, Any]:
         """Get storage statistics.
@@ -245,7 +379,7 @@ class MemoryStorage(BaseStorage):
         """
         self._ensure_open()
 
-        current_time = time.time()
+        current_time = _now()
         expired_count = sum(1 for expiry in self._expiry.values() if current_time > expiry)
 
         return {
@@ -263,4 +397,5 @@ class MemoryStorage(BaseStorage):
         if not self._closed:
             self._data.clear()
             self._expiry.clear()
+            self._expiry_heap.clear()
             await super().close()
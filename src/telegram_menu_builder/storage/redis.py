@@ -20,7 +20,7 @@ Example:
 """
 
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any, cast
 
 from redis.asyncio import Redis
@@ -265,6 +265,79 @@ class RedisStorage(BaseStorage):
         # stored value is naturally isolated from callers.
         return cast("dict[str, Any]", json.loads(raw))
 
+    async def mget(self, keys: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Retrieve several keys with a single ``MGET`` round-trip.
+
+        Args:
+            keys: Unique identifiers for the data.
+
+        Returns:
+            One entry per key, in order: a fresh dictionary parsed from storage,
+            or ``None`` if the key is missing or expired.
+
+        Raises:
+            RuntimeError: If the storage is closed.
+            StorageError: If the read fails.
+        """
+        self._ensure_open()
+        if not keys:
+            return []
+        try:
+            raw_values = await self._client.mget([self._k(key) for key in keys])
+        except RedisError as exc:
+            raise StorageError(f"Failed to get {len(keys)} keys: {exc}") from exc
+
+        return [
+            cast("dict[str, Any]", json.loads(raw)) if raw is not None else None
+            for raw in raw_values
+        ]
+
+    async def mset(self, items: Mapping[str, dict[str, Any]], ttl: int | None = None) -> None:
+        """Store several keys in one pipelined round-trip.
+
+        ``MSET`` cannot set expiries, so the ``SET ... [EX]`` commands are sent
+        through a non-transactional pipeline instead.
+
+        Args:
+            items: Mapping of keys to JSON-serializable dictionaries.
+            ttl: Time-to-live in seconds for every key (``None`` = no expiration).
+
+        Raises:
+            RuntimeError: If the storage is closed.
+            StorageError: If the write fails.
+        """
+        self._ensure_open()
+        if not items:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, data in items.items():
+                    pipe.set(self._k(key), json.dumps(data, separators=(",", ":")), ex=ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            raise StorageError(f"Failed to set {len(items)} keys: {exc}") from exc
+
+    async def mdelete(self, keys: Sequence[str]) -> int:
+        """Delete several keys with a single ``DEL`` command.
+
+        Args:
+            keys: Unique identifiers for the data.
+
+        Returns:
+            The number of keys that existed and were removed.
+
+        Raises:
+            RuntimeError: If the storage is closed.
+            StorageError: If the delete fails.
+        """
+        self._ensure_open()
+        if not keys:
+            return 0
+        try:
+            return int(await self._client.delete(*(self._k(key) for key in keys)))
+        except RedisError as exc:
+            raise StorageError(f"Failed to delete {len(keys)} keys: {exc}") from exc
+
     async def delete(self, key: str) -> bool:
         """Delete the value stored under ``key``.
 
@@ -21,6 +21,7 @@ Example:
 """
 
 import datetime
+from collections.abc import Sequence
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -493,6 +494,63 @@ class SQLAlchemyStorage(BaseStorage):
             return None
         return cast("dict[str, Any]", raw)
 
+    async def mget(self, keys: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Retrieve several (non-expired) keys with a single ``IN`` query.
+
+        Args:
+            keys: Unique identifiers for the data.
+
+        Returns:
+            One entry per key, in order: the stored dictionary, or ``None`` if
+            missing or expired.
+
+        Raises:
+            RuntimeError: If the storage is closed.
+            StorageError: If the read fails.
+        """
+        self._ensure_open()
+        if not keys:
+            return []
+
+        now = _utcnow()
+        stmt = select(self._table.c.key, self._table.c.value).where(
+            self._table.c.key.in_(set(keys)) & self._not_expired(now)
+        )
+        try:
+            async with self._engine.connect() as conn:
+                result = await conn.execute(stmt)
+                found = {row.key: row.value for row in result}
+        except SQLAlchemyError as exc:
+            raise StorageError(f"Failed to get {len(keys)} keys: {exc}") from exc
+
+        return [cast("dict[str, Any] | None", found.get(key)) for key in keys]
+
+    async def mdelete(self, keys: Sequence[str]) -> int:
+        """Delete several rows with a single ``DELETE ... IN`` statement.
+
+        Args:
+            keys: Unique identifiers for the data.
+
+        Returns:
+            The number of rows deleted.
+
+        Raises:
+            RuntimeError: If the storage is closed.
+            StorageError: If the delete fails.
+        """
+        self._ensure_open()
+        if not keys:
+            return 0
+
+        stmt = delete(self._table).where(self._table.c.key.in_(set(keys)))
+        try:
+            async with self._engine.begin() as conn:
+                result = await conn.execute(stmt)
+        except SQLAlchemyError as exc:
+            raise StorageError(f"Failed to delete {len(keys)} keys: {exc}") from exc
+
+        return int(result.rowcount)
+
     async def delete(self, key: str) -> bool:
         """Delete the row stored under ``key``.
 
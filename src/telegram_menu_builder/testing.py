@@ -16,7 +16,7 @@ It is a submodule and is intentionally *not* exported from the package's eager
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 from telegram import Update
@@ -34,9 +34,10 @@ if TYPE_CHECKING:
 ErrorHandlerFunc = Callable[[Update, ContextTypes.DEFAULT_TYPE, Exception], Awaitable[None]]
 
 
-# Inline callback-data prefixes (uncompressed / compressed). A button is "inline"
-# only when its callback_data starts with one of these — storage refs (S:/P:) are not.
-_INLINE_PREFIXES = ("I:", "IC:")
+# Inline callback-data prefixes (handler-only / uncompressed / compressed / legacy
+# compressed). A button is "inline" only when its callback_data starts with one of
+# these — storage refs (S:/P:) are not.
+_INLINE_PREFIXES = ("H:", "I:", "IZ:", "IC:")
 
 
 @dataclass(frozen=True)
@@ -127,15 +128,11 @@ async def simulate_tap(
 
     # Register a transient error handler so a swallowed routing error surfaces as
     # TapResult.handler_error, then unregister it so the router is left untouched.
-    # The router exposes no public removal for error handlers, so the internal list
-    # is snapshotted and restored; cast keeps the loosely-typed lookup type-clean.
-    error_handlers = cast("list[ErrorHandlerFunc]", getattr(router, "_error_handlers", []))
-    original = list(error_handlers)
     router.on_error(_capture_error)
     try:
         await router.route(update, context if context is not None else MagicMock())
     finally:
-        error_handlers[:] = original
+        router.remove_error_handler(_capture_error)
 
     return TapResult(
         answered=bool(callback_query.answer.called),
@@ -169,7 +166,7 @@ def assert_inline(target: "MenuBuilder | InlineKeyboardMarkup | dict[str, Any]")
     """Assert every button of ``target`` is an inline callback ref (no storage spill).
 
     A button passes when it carries ``callback_data`` that is at most 64 bytes and
-    is prefixed ``I:`` or ``IC:`` (an inline payload). URL buttons and storage refs
+    is prefixed ``H:``, ``I:``, ``IZ:`` or ``IC:`` (an inline payload). URL buttons and storage refs
     (``S:``/``P:``) fail: this helper exists to prove a menu is fully self-contained
     and needs no storage backend at runtime.
 
@@ -233,11 +230,11 @@ def _assert_inline_button(callback_data: Any, text: Any) -> None:
 
     Raises:
         AssertionError: If the callback data is missing, oversized, or not an inline
-            (``I:``/``IC:``) payload.
+            (``H:``/``I:``/``IZ:``/``IC:``) payload.
     """
     if not isinstance(callback_data, str) or not callback_data:
         raise AssertionError(f"Button {text!r} has no inline callback_data (URL or empty button)")
-    size = len(callback_data.encode("utf-8"))
+    size = len(callback_data) if callback_data.isascii() else len(callback_data.encode("utf-8"))
     if size > 64:
         raise AssertionError(
             f"Button {text!r} callback_data is {size}B, exceeding the 64-byte limit"
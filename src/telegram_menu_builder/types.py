@@ -4,14 +4,66 @@ This module contains all the fundamental data structures used throughout the lib
 implemented with Pydantic v2 for validation and type safety.
 """
 
+import functools
 import json
 from collections.abc import Awaitable, Callable
 from enum import StrEnum
-from typing import Any, Literal
+from typing import Any, Literal, cast
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Eager on purpose: importing the package loads builder and router, which need
+# python-telegram-bot at import time anyway, so deferring this import saves nothing.
 from telegram import InlineKeyboardButton
 
+# Exact types json.dumps always accepts as values. Checked with ``type(x) in ...`` so
+# subclasses (whose serialization may be customised) still take the json.dumps path.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Check, without encoding it, that ``value`` is built only from exact JSON types.
+
+    Walks nested dicts, lists and tuples with an explicit stack. ``False`` means
+    "not decided here" (another type, a subclass, or a container reached twice,
+    which may be a cycle), and the caller falls back to ``json.dumps``.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if ``value`` is certainly JSON-serializable.
+    """
+    scalar_types = _JSON_SCALAR_TYPES
+    stack: list[object] = [value]
+    seen: set[int] = set()
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type in scalar_types:
+            continue
+        if node_type is not dict and node_type is not list and node_type is not tuple:
+            return False
+        if id(node) in seen:
+            return False
+        seen.add(id(node))
+        if node_type is dict:
+            for key, item in cast("dict[Any, Any]", node).items():
+                if type(key) not in scalar_types:
+                    return False
+                if type(item) not in scalar_types:
+                    stack.append(item)
+        else:
+            items = cast("list[Any] | tuple[Any, ...]", node)
+            stack.extend(item for item in items if type(item) not in scalar_types)
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_handler_name(name: str) -> bool:
+    """Check a handler name once; the same few names are validated over and over."""
+    return name.replace("_", "").replace(".", "").isalnum()
+
 
 class StorageStrategy(StrEnum):
     """Strategy for storing callback data based on size and persistence requirements.
@@ -27,6 +79,12 @@ class StorageStrategy(StrEnum):
     PERSISTENT = "persistent"
 
 
+class _FrozenModel(BaseModel):
+    """Base for models that are built once and only read afterwards."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class MenuAction(BaseModel):
     """Represents an action to be executed when a menu item is selected.
 
@@ -61,7 +119,7 @@ class MenuAction(BaseModel):
     @classmethod
     def validate_handler_name(cls, v: str) -> str:
         """Validate handler name follows Python identifier rules."""
-        if not v.replace("_", "").replace(".", "").isalnum():
+        if not _is_valid_handler_name(v):
             raise ValueError(
                 f"Handler name '{v}' must be a valid Python identifier or dot-separated path"
             )
@@ -71,6 +129,11 @@ class MenuAction(BaseModel):
     @classmethod
     def validate_params_serializable(cls, v: dict[str, Any]) -> dict[str, Any]:
         """Validate that params contain only JSON-serializable values."""
+        # Params built from plain JSON types (the common case) need no encoding;
+        # json.dumps only decides the rest. Its output is deliberately not kept for
+        # the encoder: params stay mutable after validation, so it could go stale.
+        if _is_plain_json(v):
+            return v
         try:
             json.dumps(v)
         except (TypeError, ValueError) as e:
@@ -78,7 +141,15 @@ class MenuAction(BaseModel):
         return v
 
 
-class MenuItem(BaseModel):
+@functools.lru_cache(maxsize=4096)
+def _button_for(text: str, callback_data: str | None, url: str | None) -> InlineKeyboardButton:
+    """Build (once per distinct value) the InlineKeyboardButton for a MenuItem."""
+    if url:
+        return InlineKeyboardButton(text=text, url=url)
+    return InlineKeyboardButton(text=text, callback_data=callback_data or "")
+
+
+class MenuItem(_FrozenModel):
     """Represents a single item in an inline keyboard menu.
 
     Attributes:
@@ -93,8 +164,6 @@ class MenuItem(BaseModel):
         ... )
     """
 
-    model_config = ConfigDict(frozen=True)
-
     text: str = Field(
         ..., min_length=1, max_length=100, description="Button text displayed to user"
     )
@@ -107,21 +176,25 @@ class MenuItem(BaseModel):
     @classmethod
     def validate_callback_size(cls, v: str | None) -> str | None:
         """Ensure callback_data doesn't exceed Telegram's 64-byte limit."""
-        if v is not None and len(v.encode("utf-8")) > 64:
-            raise ValueError(
-                f"callback_data exceeds Telegram's 64-byte limit: {len(v.encode('utf-8'))} bytes"
-            )
+        if v is None:
+            return v
+        # Encoder output is ASCII, whose UTF-8 length is its length: no need to encode.
+        size = len(v) if v.isascii() else len(v.encode("utf-8"))
+        if size > 64:
+            raise ValueError(f"callback_data exceeds Telegram's 64-byte limit: {size} bytes")
         return v
 
     def to_telegram_button(self) -> InlineKeyboardButton:
         """Convert to telegram.InlineKeyboardButton.
 
+        Buttons are cached by value across items, so rebuilding a menu reuses the
+        buttons of the previous build. PTB buttons are immutable, so one instance
+        can be shared between keyboards.
+
         Returns:
             InlineKeyboardButton instance ready for use
         """
-        if self.url:
-            return InlineKeyboardButton(text=self.text, url=self.url)
-        return InlineKeyboardButton(text=self.text, callback_data=self.callback_data or "")
+        return _button_for(self.text, self.callback_data, self.url)
 
 
 class LayoutConfig(BaseModel):
@@ -149,7 +222,7 @@ class LayoutConfig(BaseModel):
     )
 
 
-class NavigationButton(BaseModel):
+class NavigationButton(_FrozenModel):
     """Configuration for a navigation button (back, next, exit).
 
     Attributes:
@@ -159,8 +232,6 @@ class NavigationButton(BaseModel):
         position: Where to place the button
     """
 
-    model_config = ConfigDict(frozen=False)
-
     text: str = Field(..., min_length=1, max_length=50, description="Button text")
     handler: str = Field(..., min_length=1, description="Handler function name")
     params: dict[str, Any] = Field(default_factory=dict, description="Handler parameters")
@@ -210,7 +281,7 @@ class NavigationConfig(BaseModel):
         return self
 
 
-class CallbackData(BaseModel):
+class CallbackData(_FrozenModel):
     """Complete callback data structure for menu interactions.
 
     This is the internal representation of all data associated with a callback.
@@ -229,8 +300,6 @@ class CallbackData(BaseModel):
         ... )
     """
 
-    model_config = ConfigDict(frozen=False)
-
     action: MenuAction = Field(..., description="Action to execute")
     menu_id: str | None = Field(default=None, max_length=50, description="Menu identifier")
     timestamp: float | None = Field(default=None, description="Creation timestamp")
@@ -248,20 +317,34 @@ returns ``None``.
 
 
 class MenuBuilderError(Exception):
-    """Base exception for menu builder errors."""
+    """Base exception for menu builder errors.
+
+    Subclasses declare empty ``__slots__`` so they add no instance layout of their own on
+    top of :class:`Exception`, keeping exceptions raised on the decode path small.
+    """
+
+    __slots__ = ()
 
 
 class EncodingError(MenuBuilderError):
     """Raised when callback data encoding fails."""
 
+    __slots__ = ()
+
 
 class DecodingError(MenuBuilderError):
     """Raised when callback data decoding fails."""
 
+    __slots__ = ()
+
 
 class StorageError(MenuBuilderError):
     """Raised when storage operations fail."""
 
+    __slots__ = ()
+
 
 class ValidationError(MenuBuilderError):
     """Raised when menu validation fails."""
+
+    __slots__ = ()
@@ -1,7 +1,27 @@
 """Pytest configuration and fixtures."""
 
+from types import MappingProxyType
+
 import pytest
 
+# Shared, read-only sample data: the fixtures hand out these views instead of building
+# a fresh dict per test. Copy with dict(...) before mutating.
+_SAMPLE_USER_DATA = MappingProxyType(
+    {
+        "user_id": 123,
+        "name": "Test User",
+        "email": "test@example.com",
+        "active": True,
+    }
+)
+_SAMPLE_MENU_PARAMS = MappingProxyType(
+    {
+        "page": 1,
+        "filters": {"active": True},
+        "breadcrumb": ["main", "users"],
+    }
+)
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -12,20 +32,11 @@ def pytest_configure(config):
 
 @pytest.fixture
 def sample_user_data():
-    """Provide sample user data for testing."""
-    return {
-        "user_id": 123,
-        "name": "Test User",
-        "email": "test@example.com",
-        "active": True,
-    }
+    """Provide sample user data for testing (read-only)."""
+    return _SAMPLE_USER_DATA
 
 
 @pytest.fixture
 def sample_menu_params():
-    """Provide sample menu parameters for testing."""
-    return {
-        "page": 1,
-        "filters": {"active": True},
-        "breadcrumb": ["main", "users"],
-    }
+    """Provide sample menu parameters for testing (read-only at the top level)."""
+    return _SAMPLE_MENU_PARAMS
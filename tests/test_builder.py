@@ -3,7 +3,10 @@
 These tests demonstrate how to use pytest to test menu construction.
 """
 
+import random
+
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 from telegram import InlineKeyboardMarkup
 
 from telegram_menu_builder import MenuBuilder
@@ -114,6 +117,18 @@ class TestMenuBuilder:
         # Should have max 3 rows of items + navigation
         assert len(menu.inline_keyboard) <= 3
 
+    def test_max_rows_truncates_to_full_rows(self, builder):
+        """max_rows keeps exactly columns * max_rows items, in order."""
+        for i in range(7):
+            builder.add_item(f"Item {i}", handler=f"h{i}")
+
+        full = builder.columns(3).to_markup()
+        truncated = builder.max_rows(2).to_markup()
+
+        assert [len(row) for row in full.inline_keyboard] == [3, 3, 1]
+        assert [len(row) for row in truncated.inline_keyboard] == [3, 3]
+        assert truncated.inline_keyboard[1][2].text == "Item 5"
+
     def test_back_button(self, builder):
         """Test adding back button."""
         menu = (
@@ -133,6 +148,11 @@ class TestMenuBuilder:
         # Last row should have 2 buttons (back and next)
         assert len(menu.inline_keyboard[-1]) == 2
 
+    def test_invalid_navigation_handler_fails_when_added(self, builder):
+        """A navigation button's action is validated when it is added, not at build."""
+        with pytest.raises(PydanticValidationError):
+            builder.add_back_button(handler="not valid!")
+
     def test_exit_button_separate_row(self, builder):
         """Test that exit button appears on separate row."""
         menu = builder.add_item("Item", handler="test").add_exit_button().build()
@@ -190,6 +210,53 @@ class TestMenuBuilder:
         assert action.handler == "greet"
         assert action.params == {"user_id": 7}
 
+    def test_inline_build_does_not_start_event_loop(self, builder, monkeypatch):
+        """build() assembles an all-inline menu without asyncio.run or a worker thread."""
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("build() should not need an event loop here")
+
+        monkeypatch.setattr("telegram_menu_builder.builder.asyncio.run", _fail)
+        monkeypatch.setattr("telegram_menu_builder.builder.threading.Thread", _fail)
+
+        menu = builder.add_item("Item", handler="test", id=1).add_back_button().build()
+
+        assert menu.inline_keyboard[0][0].callback_data.startswith("I:")
+
+    async def test_sync_build_spills_oversize_item(self, storage):
+        """build() falls back to the storage-backed build when an item must spill."""
+        blob = random.Random(0).randbytes(250).hex()
+        builder = MenuBuilder(storage=storage)
+        builder.add_item("Small", handler="small").add_item("Big", handler="big", blob=blob)
+
+        menu = builder.build()
+        callback_data = menu.inline_keyboard[0][1].callback_data
+
+        assert callback_data.startswith(("S:", "P:"))
+        action = await CallbackEncoder(storage).decode(callback_data)
+        assert action.params == {"blob": blob}
+
+    def test_sync_build_only_defers_oversize_items(self, storage, monkeypatch):
+        """build() encodes inline items synchronously and batches only the spills."""
+        batches = []
+        encode_many = CallbackEncoder.encode_many
+
+        async def spy(self, actions):
+            batches.append([action.handler for action in actions])
+            return await encode_many(self, actions)
+
+        monkeypatch.setattr(CallbackEncoder, "encode_many", spy)
+        blob = random.Random(0).randbytes(250).hex()
+        builder = MenuBuilder(storage=storage)
+        builder.add_item("Small", handler="small").add_item("Big", handler="big", blob=blob)
+        builder.add_back_button(handler="back")
+
+        menu = builder.build()
+
+        assert batches == [["big"]]
+        assert menu.inline_keyboard[0][0].callback_data == "H:small"
+        assert menu.inline_keyboard[1][0].callback_data == "H:back"
+
     async def test_submenu_builds_without_serialization_error(self, storage):
         """add_submenu encodes successfully (the builder object is not serialized)."""
         submenu = MenuBuilder(storage=storage).add_item("Sub", handler="sub_handler")
@@ -203,6 +270,37 @@ class TestMenuBuilder:
         assert action.params["_submenu_id"] == id(submenu)
         assert builder.get_submenu(id(submenu)) is submenu
 
+    def test_submenu_adopts_parent_storage(self, storage):
+        """A submenu without explicit storage (and its own submenus) uses the parent's."""
+        leaf = MenuBuilder().add_item("Leaf", handler="leaf")
+        submenu = MenuBuilder().add_submenu("Leaf", leaf)
+        parent = MenuBuilder(storage=storage).add_submenu("Sub", submenu)
+
+        assert submenu.storage is storage
+        assert leaf.storage is storage
+        assert submenu.encoder is parent.encoder
+
+    def test_submenu_keeps_explicit_storage(self, storage):
+        """A submenu created with its own storage keeps it."""
+        own_storage = MemoryStorage()
+        submenu = MenuBuilder(storage=own_storage).add_item("Sub", handler="sub")
+        MenuBuilder(storage=storage).add_submenu("Sub", submenu)
+
+        assert submenu.storage is own_storage
+
+    def test_submenu_cycle_does_not_recurse_forever(self):
+        """Submenus that reference each other still adopt storage without looping."""
+        first = MenuBuilder()
+        second = MenuBuilder().add_submenu("First", first)
+        first.add_submenu("Second", second)
+
+        assert first.storage is second.storage
+
+    def test_builder_and_encoder_use_slots(self, builder):
+        """MenuBuilder and its encoder carry no per-instance __dict__."""
+        assert not hasattr(builder, "__dict__")
+        assert not hasattr(builder.encoder, "__dict__")
+
     def test_fluent_api_chaining(self, builder):
         """Test that all methods return self for chaining."""
         result = (
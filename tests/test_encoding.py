@@ -1,25 +1,45 @@
 """Test suite for encoding/decoding functionality."""
 
 import asyncio
+import base64
+import hashlib
+import json
+import random
+import time
+import zlib
 
 import pytest
 
+from telegram_menu_builder import encoding
 from telegram_menu_builder.encoding import CallbackEncoder, estimate_encoded_size
 from telegram_menu_builder.storage import MemoryStorage
 from telegram_menu_builder.types import DecodingError, MenuAction
 
+# Random hex does not compress, so these payloads never fit the 64-byte inline budget.
+# MEDIUM_BLOB lands in short-term (TTL) storage, LARGE_BLOB in persistent storage.
+_rng = random.Random(0)
+MEDIUM_BLOB = _rng.randbytes(100).hex()
+LARGE_BLOB = _rng.randbytes(500).hex()
+
+
+@pytest.fixture(scope="module")
+def storage():
+    """Provide one storage instance shared by the module, emptied after each test."""
+    return MemoryStorage()
+
 
 class TestCallbackEncoder:
     """Tests for CallbackEncoder class."""
 
-    @pytest.fixture
-    def storage(self):
-        """Provide a fresh storage instance."""
-        return MemoryStorage()
+    @pytest.fixture(autouse=True)
+    async def _empty_storage(self, storage):
+        """Empty the shared storage after each test so tests stay independent."""
+        yield
+        await storage.clear()
 
     @pytest.fixture
     def encoder(self, storage):
-        """Provide a fresh encoder instance."""
+        """Provide a fresh encoder instance (its key cache is per-test state)."""
         return CallbackEncoder(storage)
 
     @pytest.mark.asyncio
@@ -62,7 +82,7 @@ class TestCallbackEncoder:
 
         encoded = await encoder.encode(action)
 
-        # Should be inline (starts with I: or IC:)
+        # Should be inline (starts with I: or IZ:)
         assert encoded.startswith("I")
         assert len(encoded) <= 64
 
@@ -70,13 +90,21 @@ class TestCallbackEncoder:
     async def test_storage_for_large_data(self, encoder):
         """Test that large data is stored externally."""
         # Create action with large params
-        action = MenuAction(handler="test_handler", params={"data": "x" * 500})  # Large string
+        action = MenuAction(handler="test_handler", params={"data": LARGE_BLOB})
 
         encoded = await encoder.encode(action)
 
         # Should use storage (starts with S: or P:)
         assert encoded.startswith(("S:", "P:"))
 
+    def test_prefix_table_covers_every_prefix(self):
+        """The decode dispatch table is keyed by exactly the PREFIX_* constants."""
+        prefixes = {
+            value for name, value in vars(CallbackEncoder).items() if name.startswith("PREFIX_")
+        }
+
+        assert set(CallbackEncoder._PREFIX_STRATEGIES) == prefixes
+
     @pytest.mark.asyncio
     async def test_decode_invalid_data_raises_error(self, encoder):
         """Test that decoding invalid data raises DecodingError."""
@@ -84,22 +112,19 @@ class TestCallbackEncoder:
             await encoder.decode("INVALID_DATA_HERE")
 
     @pytest.mark.asyncio
-    async def test_decode_expired_data_raises_error(self, encoder):
+    async def test_decode_expired_data_raises_error(self, encoder, monkeypatch):
         """Test that decoding expired data raises DecodingError."""
-        # Create large data to force short-term storage usage (not inline)
-        action = MenuAction(handler="test", params={"data": "x" * 1000})
+        # Create medium-sized data to force short-term storage usage (not inline)
+        action = MenuAction(handler="test", params={"data": MEDIUM_BLOB})
 
-        # Encode with very short TTL
-        action.ttl = 1
         encoded = await encoder.encode(action)
 
-        # Verify it's using storage (not inline)
-        if encoded.startswith(("I", "IC")):
-            # If inline, we can't test expiration, so skip
-            pytest.skip("Data was encoded inline, cannot test expiration")
+        # Verify it's using short-term storage (which has a TTL)
+        assert encoded.startswith(CallbackEncoder.PREFIX_SHORT)
 
-        # Wait for expiration
-        await asyncio.sleep(2)
+        # Advance the storage clock past the TTL instead of sleeping
+        future = time.monotonic() + action.ttl + 1
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
 
         # Should raise DecodingError
         with pytest.raises(DecodingError, match=r"expired|not found"):
@@ -108,8 +133,8 @@ class TestCallbackEncoder:
     @pytest.mark.asyncio
     async def test_cleanup_callback(self, encoder):
         """Test cleanup of stored callback data."""
-        # Create large data to force storage usage
-        action = MenuAction(handler="test", params={"data": "x" * 1000})
+        # Create medium-sized data to force short-term storage usage
+        action = MenuAction(handler="test", params={"data": MEDIUM_BLOB})
 
         encoded = await encoder.encode(action)
 
@@ -149,6 +174,40 @@ class TestCallbackEncoder:
         assert size > 0
         assert size < 1000  # Reasonable size
 
+    def test_estimate_matches_json_length(self):
+        """The estimate is derived from the exact compact JSON length for ASCII data."""
+        action = MenuAction(
+            handler="edit",
+            params={"id": -3, "ratio": 2.5, "tags": ["a", None, True, False], "meta": {}},
+        )
+        json_size = len(
+            json.dumps({"h": action.handler, "p": action.params}, separators=(",", ":"))
+        )
+
+        assert estimate_encoded_size(action) == int(json_size * 0.7 * 1.25 + 3)
+
+    async def test_estimate_is_exact_for_verbatim_tiers(self, encoder):
+        """H: and I: payloads are carried verbatim, so their estimate is exact."""
+        for action in (
+            MenuAction(handler="back"),
+            MenuAction(handler="edit_user", params={"id": 123, "field": "email"}),
+            MenuAction(handler="h", params={"a": 'x"y'}),
+            MenuAction(handler="h", params={"a": "\n", "b": "\\"}),
+            MenuAction(handler="h", params={"a": "\U0001f680", "b": "é"}),
+            MenuAction(handler="h", params={"f": [1.5, True], "n": None}),
+        ):
+            encoded = await encoder.encode(action)
+            assert encoded.startswith(("H:", "I:"))
+            assert not encoded.startswith("IZ:")
+            assert estimate_encoded_size(action) == len(encoded)
+
+    async def test_estimate_keeps_encoder_handler_guard(self, encoder):
+        """A parameterless handler too long for H: is not estimated as an H: callback."""
+        action = MenuAction(handler="a" * 63)
+
+        assert (await encoder.encode(action)).startswith("IZ:")
+        assert estimate_encoded_size(action) != len("H:") + 63
+
     @pytest.mark.asyncio
     async def test_compression_reduces_size(self, encoder):
         """Test that compression works for repetitive data."""
@@ -159,3 +218,168 @@ class TestCallbackEncoder:
 
         # Should be inline due to compression
         assert encoded.startswith("I")
+
+    async def test_compressed_tier_uses_deflate_base85(self, encoder):
+        """Compressible payloads too long for the raw tier use the IZ: tier."""
+        action = MenuAction(handler="test", params={"data": "x" * 500})
+
+        encoded = await encoder.encode(action)
+
+        assert encoded.startswith(CallbackEncoder.PREFIX_INLINE_COMPRESSED)
+        assert len(encoded) <= 64
+        decoded = await encoder.decode(encoded)
+        assert decoded.params == {"data": "x" * 500}
+
+    async def test_raw_tier_that_fits_is_not_compressed(self, encoder):
+        """A payload whose raw JSON fits stays in I:, even if it would compress."""
+        action = MenuAction(handler="test", params={"data": "a" * 30})
+
+        encoded = await encoder.encode(action)
+
+        assert encoded == 'I:{"h":"test","p":{"data":"' + "a" * 30 + '"}}'
+
+    async def test_decode_legacy_compressed_tier(self, encoder):
+        """Callbacks produced by the old zlib + base64 tier still decode."""
+        payload = json.dumps({"h": "test", "p": {"data": "a" * 50}}, separators=(",", ":"))
+        legacy = "IC:" + base64.b64encode(zlib.compress(payload.encode("utf-8"), 9)).decode()
+
+        decoded = await encoder.decode(legacy)
+
+        assert decoded.handler == "test"
+        assert decoded.params == {"data": "a" * 50}
+
+    async def test_encode_many_dedupes_identical_actions(self, encoder, monkeypatch):
+        """Identical actions in one batch share a callback and a single storage write."""
+        writes = []
+        original_set = MemoryStorage.set
+
+        async def counting_set(self, key, data, ttl=None):
+            writes.append(key)
+            await original_set(self, key, data, ttl=ttl)
+
+        monkeypatch.setattr(MemoryStorage, "set", counting_set)
+        actions = [
+            MenuAction(handler="page", params={"blob": MEDIUM_BLOB}),
+            MenuAction(handler="page", params={"id": 1}),
+            MenuAction(handler="page", params={"blob": MEDIUM_BLOB}),
+        ]
+
+        encoded = await encoder.encode_many(actions)
+
+        assert len(encoded) == 3
+        assert encoded[0] == encoded[2]
+        assert encoded[0].startswith("S:")
+        assert encoded[1].startswith("I:")
+        assert len(writes) == 1
+
+    async def test_key_cache_reuses_key(self, encoder):
+        """Re-encoding a spilled payload reuses the memoized storage key."""
+        action = MenuAction(handler="test", params={"blob": MEDIUM_BLOB})
+
+        first = await encoder.encode(action)
+        second = await encoder.encode(action)
+
+        assert first == second
+        assert len(encoder._key_cache) == 1
+
+    async def test_storage_key_is_blake2b_digest(self, encoder):
+        """Spilled payloads are keyed by a 6-byte BLAKE2b digest of the canonical JSON."""
+        action = MenuAction(handler="test", params={"blob": MEDIUM_BLOB})
+        canonical = json.dumps(
+            {"h": "test", "p": {"blob": MEDIUM_BLOB}}, sort_keys=True, separators=(",", ":")
+        )
+
+        encoded = await encoder.encode(action)
+
+        expected = hashlib.blake2b(canonical.encode("utf-8"), digest_size=6).hexdigest()
+        assert encoded == f"S:{expected}"
+        assert len(expected) == 12
+
+    async def test_encode_many_overlaps_storage_writes(self, encoder, monkeypatch):
+        """Distinct spills in one batch are written concurrently, not one after another."""
+        in_flight = 0
+        peak = 0
+        original_set = MemoryStorage.set
+
+        async def slow_set(self, key, data, ttl=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            await original_set(self, key, data, ttl=ttl)
+
+        monkeypatch.setattr(MemoryStorage, "set", slow_set)
+        actions = [MenuAction(handler=f"h{i}", params={"blob": MEDIUM_BLOB}) for i in range(3)]
+
+        encoded = await encoder.encode_many(actions)
+
+        assert peak == 3
+        for action, callback_data in zip(actions, encoded, strict=True):
+            assert (await encoder.decode(callback_data)).handler == action.handler
+
+    async def test_decode_many_batches_storage_reads(self, encoder, monkeypatch):
+        """decode_many decodes inline callbacks directly and reads storage once."""
+        actions = [
+            MenuAction(handler="small", params={"n": 1}),
+            MenuAction(handler="medium", params={"data": MEDIUM_BLOB}),
+            MenuAction(handler="large", params={"data": LARGE_BLOB}),
+        ]
+        encoded = await encoder.encode_many(actions)
+        batches = []
+        mget = MemoryStorage.mget
+
+        async def spy(self, keys):
+            batches.append(list(keys))
+            return await mget(self, keys)
+
+        monkeypatch.setattr(MemoryStorage, "mget", spy)
+
+        decoded = await encoder.decode_many(encoded)
+
+        assert decoded == actions
+        assert [len(keys) for keys in batches] == [2]
+
+    async def test_decode_many_missing_data_raises_error(self, encoder, storage):
+        """A storage-backed callback whose data is gone fails the whole batch."""
+        encoded = await encoder.encode(MenuAction(handler="h", params={"data": MEDIUM_BLOB}))
+        await storage.clear()
+
+        with pytest.raises(DecodingError, match="expired or not found"):
+            await encoder.decode_many(["H:ok", encoded])
+
+    async def test_parameterless_action_uses_handler_prefix(self, encoder):
+        """Actions without params encode as the bare handler name under H:."""
+        action = MenuAction(handler="users.go_back")
+
+        encoded = await encoder.encode(action)
+
+        assert encoded == "H:users.go_back"
+        assert encoder.encode_inline(action) == encoded
+        decoded = await encoder.decode(encoded)
+        assert decoded.handler == "users.go_back"
+        assert decoded.params == {}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_canonical_json_matches_stdlib(self, use_orjson, monkeypatch):
+        """Canonical JSON is identical with or without orjson, including non-ASCII and floats."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(encoding, "_orjson", None)
+        for data in (
+            {"p": {"name": "Zoë", "b": [1, 2.5, None], "a": {"2": True}}, "h": "edit"},
+            {"p": {"v": float("nan")}, "h": "edit"},
+            {"p": {"v": [float("inf"), float("-inf")]}, "h": "edit"},
+            {"p": {"v": 1e-7}, "h": "edit"},
+        ):
+            canonical = encoding._canonical_json(data)
+
+            expected = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            assert canonical == expected.encode("utf-8")
+
+    def test_canonical_json_falls_back_for_non_string_keys(self):
+        """Payloads orjson rejects (non-string keys) still serialize via stdlib json."""
+        data = {"h": "edit", "p": {"ids": {1: "a"}}}
+
+        assert encoding._canonical_json(data) == b'{"h":"edit","p":{"ids":{"1":"a"}}}'
@@ -119,6 +119,15 @@ class TestRedisStorage:
         source["value"] = 999
         assert await storage.get("k") == {"value": 1}
 
+    async def test_batch_operations(self, storage):
+        """mget/mset/mdelete mirror get/set/delete for several keys at once."""
+        await storage.mset({"a": {"v": 1}, "b": {"v": 2}}, ttl=60)
+
+        assert await storage.mget(["a", "missing", "b"]) == [{"v": 1}, None, {"v": 2}]
+        assert await storage.mget([]) == []
+        assert await storage.mdelete(["a", "missing"]) == 1
+        assert await storage.mget(["a", "b"]) == [None, {"v": 2}]
+
     async def test_delete(self, storage):
         """delete returns True when a key existed, False otherwise."""
         await storage.set("k", {"v": 1})
@@ -4,7 +4,10 @@ These tests use lightweight mocks for the Telegram Update/CallbackQuery objects
 that routing, middleware, and error handling can be exercised without a live bot.
 """
 
+import asyncio
 import logging
+import random
+import sys
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -26,6 +29,21 @@ def make_update(data):
     return update
 
 
+def record_storage_gets(monkeypatch, delay=0.0):
+    """Record the keys MemoryStorage.get is called with, optionally slowing it down."""
+    lookups = []
+    original_get = MemoryStorage.get
+
+    async def recording_get(self, key):
+        lookups.append(key)
+        if delay:
+            await asyncio.sleep(delay)
+        return await original_get(self, key)
+
+    monkeypatch.setattr(MemoryStorage, "get", recording_get)
+    return lookups
+
+
 class TestMenuRouter:
     """Tests for the MenuRouter dispatch logic."""
 
@@ -39,6 +57,11 @@ class TestMenuRouter:
         """Provide a router sharing the storage so encode/decode round-trips."""
         return MenuRouter(storage=storage)
 
+    @pytest.fixture
+    def cached_router(self, storage):
+        """Provide a router with the (opt-in) decode cache enabled."""
+        return MenuRouter(storage=storage, decode_cache_size=1024)
+
     @pytest.fixture
     def context(self):
         """Provide a fake Telegram context."""
@@ -73,6 +96,10 @@ class TestMenuRouter:
         await router.route(make_update(encoded), context)
         assert seen == {"id": 1}
 
+    def test_router_uses_slots(self, router):
+        """MenuRouter carries no per-instance __dict__."""
+        assert not hasattr(router, "__dict__")
+
     async def test_middleware_runs_in_order(self, router, context):
         """before -> handler -> after middleware execute in sequence."""
         calls = []
@@ -95,6 +122,59 @@ class TestMenuRouter:
 
         assert calls == ["before", "handler", "after"]
 
+    async def test_middleware_added_after_routing_is_used(self, router, context):
+        """Registering middleware after a route recompiles the dispatch chain."""
+        calls = []
+        router.register_handler("h", AsyncMock())
+        encoded = await self._encode(router, "h", {})
+        await router.route(make_update(encoded), context)
+
+        @router.after
+        async def after(update, ctx, params):
+            calls.append("after")
+
+        await router.route(make_update(encoded), context)
+
+        assert calls == ["after"]
+
+    async def test_concurrent_middleware_overlaps_each_stage(self, storage, context):
+        """With concurrent_middleware, middleware of one stage run at the same time."""
+        router = MenuRouter(storage=storage, concurrent_middleware=True)
+        calls = []
+        gate = asyncio.Event()
+
+        @router.before
+        async def waits(update, ctx, params):
+            await gate.wait()
+            calls.append("before:waits")
+
+        @router.before
+        async def releases(update, ctx, params):
+            gate.set()
+            calls.append("before:releases")
+
+        async def handler(update, ctx, params):
+            calls.append("handler")
+
+        router.register_handler("h", handler)
+        router.after(AsyncMock(side_effect=lambda *args: calls.append("after")))
+
+        await router.route(make_update(await self._encode(router, "h", {})), context)
+
+        assert calls == ["before:releases", "before:waits", "handler", "after"]
+
+    async def test_before_middleware_runs_for_unknown_handler(self, router, context):
+        """before middleware still runs when no handler matches; after does not."""
+        calls = []
+        router.before(AsyncMock(side_effect=lambda *args: calls.append("before")))
+        router.after(AsyncMock(side_effect=lambda *args: calls.append("after")))
+
+        update = make_update(await self._encode(router, "missing", {}))
+        await router.route(update, context)
+
+        assert calls == ["before"]
+        update.callback_query.answer.assert_awaited_once_with("Action not available")
+
     async def test_unknown_handler_without_default(self, router, context):
         """Unknown handler and no default -> answers 'Action not available'."""
         encoded = await self._encode(router, "missing", {})
@@ -128,6 +208,17 @@ class TestMenuRouter:
         error_handler.assert_awaited_once()
         update.callback_query.answer.assert_awaited_once_with("Invalid or expired action")
 
+    async def test_remove_error_handler(self, router, context):
+        """A removed error handler no longer runs; removing it twice reports False."""
+        error_handler = AsyncMock()
+        router.on_error(error_handler)
+
+        assert router.remove_error_handler(error_handler) is True
+        assert router.remove_error_handler(error_handler) is False
+
+        await router.route(make_update("THIS_IS_NOT_VALID"), context)
+        error_handler.assert_not_awaited()
+
     async def test_handler_exception_triggers_error_handler(self, router, context):
         """An exception raised inside a handler is caught and reported."""
         error_handler = AsyncMock()
@@ -160,6 +251,46 @@ class TestMenuRouter:
         handler.assert_awaited_once()
         update.callback_query.answer.assert_not_awaited()
 
+    async def test_eager_answer_overlaps_handler(self, storage, context):
+        """With eager_answer the query is answered while the handler is still running."""
+        router = MenuRouter(storage=storage, eager_answer=True)
+        update = make_update(None)
+        answered_during_handler = []
+
+        async def handler(update, ctx, params):
+            await asyncio.sleep(0)
+            answered_during_handler.append(update.callback_query.answer.await_count)
+
+        router.register_handler("h", handler)
+        update.callback_query.data = await self._encode(router, "h", {})
+
+        await router.route(update, context)
+
+        assert answered_during_handler == [1]
+        update.callback_query.answer.assert_awaited_once_with()
+
+    async def test_eager_answer_failing_handler_answers_once(self, storage, context):
+        """A failing handler still reaches on_error without a second answer."""
+        router = MenuRouter(storage=storage, eager_answer=True)
+        error_handler = AsyncMock()
+        router.on_error(error_handler)
+        router.register_handler("boom", AsyncMock(side_effect=RuntimeError("kaboom")))
+
+        update = make_update(await self._encode(router, "boom", {}))
+        await router.route(update, context)
+
+        error_handler.assert_awaited_once()
+        update.callback_query.answer.assert_awaited_once_with()
+
+    async def test_eager_answer_not_used_for_unknown_handler(self, storage, context):
+        """Unhandled actions still get the 'Action not available' answer."""
+        router = MenuRouter(storage=storage, eager_answer=True)
+
+        update = make_update(await self._encode(router, "missing", {}))
+        await router.route(update, context)
+
+        update.callback_query.answer.assert_awaited_once_with("Action not available")
+
     async def test_no_callback_query_is_ignored(self, router, context):
         """An update without a callback_query is ignored without error."""
         update = MagicMock()
@@ -208,6 +339,242 @@ class TestMenuRouter:
 
         default.assert_awaited_once_with(update, context, {"k": 1})
 
+    async def test_repeated_press_skips_storage(self, cached_router, context, monkeypatch):
+        """A cached decode serves repeat presses without a storage lookup."""
+        handler = AsyncMock()
+        cached_router.register_handler("big", handler)
+        encoded = await self._encode(
+            cached_router, "big", {"blob": random.Random(0).randbytes(100).hex()}
+        )
+        assert encoded.startswith(("S:", "P:"))
+
+        lookups = record_storage_gets(monkeypatch)
+        await cached_router.route(make_update(encoded), context)
+        await cached_router.route(make_update(encoded), context)
+
+        assert len(lookups) == 1
+        assert handler.await_count == 2
+
+    async def test_cached_params_are_isolated_per_press(self, cached_router, context):
+        """A handler mutating its params does not leak into the next press."""
+        seen = []
+
+        async def handler(update, context, params):
+            seen.append(dict(params))
+            params["mutated"] = True
+
+        cached_router.register_handler("greet", handler)
+        encoded = await self._encode(cached_router, "greet", {"user_id": 7})
+        await cached_router.route(make_update(encoded), context)
+        await cached_router.route(make_update(encoded), context)
+
+        assert seen == [{"user_id": 7}, {"user_id": 7}]
+
+    async def test_decode_cache_expires(self, cached_router, context, monkeypatch):
+        """Entries past decode_cache_ttl are decoded from storage again."""
+        clock = [1000.0]
+        monkeypatch.setattr("telegram_menu_builder.router.time.monotonic", lambda: clock[0])
+        cached_router.register_handler("big", AsyncMock())
+        encoded = await self._encode(
+            cached_router, "big", {"blob": random.Random(0).randbytes(100).hex()}
+        )
+
+        lookups = record_storage_gets(monkeypatch)
+        await cached_router.route(make_update(encoded), context)
+        clock[0] += 61
+        await cached_router.route(make_update(encoded), context)
+
+        assert len(lookups) == 2
+
+    async def test_concurrent_presses_share_one_lookup(self, storage, context, monkeypatch):
+        """Concurrent decodes of one callback issue a single storage lookup."""
+        router = MenuRouter(storage=storage, decode_cache_size=0)
+        seen = []
+
+        async def handler(update, ctx, params):
+            seen.append(params)
+
+        router.register_handler("big", handler)
+        params = {"blob": random.Random(0).randbytes(100).hex()}
+        encoded = await self._encode(router, "big", params)
+
+        lookups = record_storage_gets(monkeypatch, delay=0.01)
+        await asyncio.gather(*(router.route(make_update(encoded), context) for _ in range(5)))
+
+        assert len(lookups) == 1
+        assert seen == [params] * 5
+        assert len({id(p) for p in seen}) == 5
+        assert router._inflight == {}
+
+    async def test_unshared_decode_is_not_copied(self, router, context, monkeypatch):
+        """Without the cache, a decode no other press joined skips the defensive copy."""
+        copies = []
+        model_copy = MenuAction.model_copy
+
+        def spy(self, *args, **kwargs):
+            copies.append(self)
+            return model_copy(self, *args, **kwargs)
+
+        monkeypatch.setattr(MenuAction, "model_copy", spy)
+        router.register_handler("greet", AsyncMock())
+        await router.route(make_update(await self._encode(router, "greet", {"id": 1})), context)
+
+        assert copies == []
+
+    async def test_leader_mutation_does_not_leak_to_followers(self, router, context, monkeypatch):
+        """Presses sharing one decode each get params the others cannot mutate."""
+        seen = []
+
+        async def handler(update, ctx, params):
+            seen.append(dict(params))
+            params["mutated"] = True
+
+        router.register_handler("big", handler)
+        params = {"blob": random.Random(0).randbytes(100).hex()}
+        encoded = await self._encode(router, "big", params)
+
+        record_storage_gets(monkeypatch, delay=0.01)
+        await asyncio.gather(*(router.route(make_update(encoded), context) for _ in range(3)))
+
+        assert seen == [params] * 3
+        assert router._inflight_followers == {}
+
+    async def test_cancelled_leader_does_not_cancel_followers(self, storage, context, monkeypatch):
+        """Presses waiting on a cancelled in-flight decode retry it instead of failing."""
+        router = MenuRouter(storage=storage)
+        handler = AsyncMock()
+        router.register_handler("big", handler)
+        encoded = await self._encode(router, "big", {"blob": random.Random(0).randbytes(100).hex()})
+
+        lookups = record_storage_gets(monkeypatch, delay=0.05)
+        leader = asyncio.create_task(router.route(make_update(encoded), context))
+        await asyncio.sleep(0.01)
+        followers = [
+            asyncio.create_task(router.route(make_update(encoded), context)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert handler.await_count == 2
+        assert len(lookups) == 2
+        assert router._inflight == {}
+
+    async def test_slow_decode_is_hedged(self, storage, context, monkeypatch):
+        """A storage lookup slower than hedge_after is raced by a second lookup."""
+        router = MenuRouter(storage=storage, hedge_after=0.01)
+        handler = AsyncMock()
+        router.register_handler("big", handler)
+        params = {"blob": random.Random(0).randbytes(100).hex()}
+        encoded = await self._encode(router, "big", params)
+
+        lookups = []
+        cancelled = []
+        original_get = MemoryStorage.get
+
+        async def first_lookup_stalls(self, key):
+            lookups.append(key)
+            if len(lookups) == 1:
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(key)
+                    raise
+            return await original_get(self, key)
+
+        monkeypatch.setattr(MemoryStorage, "get", first_lookup_stalls)
+        update = make_update(encoded)
+        await asyncio.wait_for(router.route(update, context), timeout=5)
+        await asyncio.sleep(0)  # let the losing lookup observe its cancellation
+
+        assert len(lookups) == 2
+        assert cancelled == lookups[:1]
+        handler.assert_awaited_once_with(update, context, params)
+
+    async def test_fast_decode_is_not_hedged(self, storage, context, monkeypatch):
+        """A lookup that beats hedge_after (or an inline callback) is decoded once."""
+        router = MenuRouter(storage=storage, hedge_after=1.0)
+        router.register_handler("big", AsyncMock())
+        encoded = await self._encode(router, "big", {"blob": random.Random(0).randbytes(100).hex()})
+
+        lookups = record_storage_gets(monkeypatch)
+        await router.route(make_update(encoded), context)
+        await router.route(make_update(await self._encode(router, "big", {})), context)
+
+        assert len(lookups) == 1
+
+    async def test_decoding_error_is_cached(self, cached_router, context, monkeypatch):
+        """A failed decode is remembered briefly and still reported as an error."""
+        lookups = record_storage_gets(monkeypatch)
+        updates = [make_update("S:000000000000"), make_update("S:000000000000")]
+        for update in updates:
+            await cached_router.route(update, context)
+            update.callback_query.answer.assert_awaited_once_with("Invalid or expired action")
+
+        assert len(lookups) == 1
+
+    async def test_decode_cache_is_off_by_default(self, router, context):
+        """Without decode_cache_size, a deleted storage entry stops dispatching at once."""
+        handler = AsyncMock()
+        router.register_handler("big", handler)
+        encoded = await self._encode(router, "big", {"blob": random.Random(0).randbytes(100).hex()})
+        await router.route(make_update(encoded), context)
+
+        await router.storage.clear()
+        update = make_update(encoded)
+        await router.route(update, context)
+
+        assert handler.await_count == 1
+        update.callback_query.answer.assert_awaited_once_with("Invalid or expired action")
+
+    async def test_storage_errors_are_not_cached(self, cached_router, context, monkeypatch):
+        """A failing backend is retried on the next press instead of being cached."""
+        handler = AsyncMock()
+        cached_router.register_handler("big", handler)
+        params = {"blob": random.Random(0).randbytes(100).hex()}
+        encoded = await self._encode(cached_router, "big", params)
+        original_get = MemoryStorage.get
+
+        async def outage(self, key):
+            raise ConnectionError("backend unavailable")
+
+        monkeypatch.setattr(MemoryStorage, "get", outage)
+        await cached_router.route(make_update(encoded), context)
+        monkeypatch.setattr(MemoryStorage, "get", original_get)
+        update = make_update(encoded)
+        await cached_router.route(update, context)
+
+        assert cached_router._decode_errors == {}
+        handler.assert_awaited_once_with(update, context, params)
+
+    async def test_decode_cache_evicts_least_recently_used(self, storage, context):
+        """The cache never holds more than decode_cache_size entries."""
+        router = MenuRouter(storage=storage, decode_cache_size=2)
+        router.register_handler("h", AsyncMock())
+        for n in range(3):
+            encoded = await self._encode(router, "h", {"n": n})
+            await router.route(make_update(encoded), context)
+
+        assert len(router._decode_cache) == 2
+
+    async def test_failed_decodes_do_not_evict_valid_entries(self, storage, context, monkeypatch):
+        """Bogus callbacks fill a separate, bounded LRU instead of the decode cache."""
+        monkeypatch.setattr("telegram_menu_builder.router._NEGATIVE_DECODE_CACHE_SIZE", 3)
+        router = MenuRouter(storage=storage, decode_cache_size=5)
+        router.register_handler("h", AsyncMock())
+        encoded = await self._encode(router, "h", {"blob": random.Random(0).randbytes(100).hex()})
+        await router.route(make_update(encoded), context)
+
+        for n in range(10):
+            await router.route(make_update(f"S:{n:012d}"), context)
+
+        lookups = record_storage_gets(monkeypatch)
+        await router.route(make_update(encoded), context)
+        assert lookups == []
+        assert len(router._decode_cache) == 1
+        assert len(router._decode_errors) == 3
+
     def test_properties_expose_storage_and_encoder(self, storage):
         """The storage and encoder properties return the configured instances."""
         router = MenuRouter(storage=storage)
@@ -286,3 +653,24 @@ class TestRouterGroup:
 
         group.register_handler("ban", ban)
         assert "admin.ban" in router.list_handlers()
+
+    def test_register_handlers_prefixes_every_name(self, router):
+        """RouterGroup.register_handlers applies the prefix to each name in the mapping."""
+        group = RouterGroup("admin", router)
+        ban, kick = AsyncMock(), AsyncMock()
+
+        group.register_handlers({"ban": ban, "kick": kick})
+
+        assert sorted(router.list_handlers()) == ["admin.ban", "admin.kick"]
+        assert router.get_handler("admin.kick") is kick
+
+    def test_registered_names_are_interned(self, router):
+        """Prefixed names are interned, so equal names share one string object."""
+        group = RouterGroup("admin", router)
+
+        async def ban(update, ctx, params):
+            pass
+
+        group.register_handler("".join(["b", "an"]), ban)
+        (name,) = router.list_handlers()
+        assert name is sys.intern("admin.ban")
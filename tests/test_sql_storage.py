@@ -102,6 +102,15 @@ class TestSQLAlchemyStorage:
         assert await storage.get("k") is None
         assert await storage.exists("k") is False
 
+    async def test_batch_operations(self, storage):
+        """mget/mset/mdelete mirror get/set/delete for several keys at once."""
+        await storage.mset({"a": {"v": 1}, "b": {"v": 2}}, ttl=60)
+
+        assert await storage.mget(["a", "missing", "b"]) == [{"v": 1}, None, {"v": 2}]
+        assert await storage.mget([]) == []
+        assert await storage.mdelete(["a", "missing"]) == 1
+        assert await storage.mget(["a", "b"]) == [None, {"v": 2}]
+
     async def test_delete(self, storage):
         """delete returns True when a key existed, False otherwise."""
         await storage.set("k", {"v": 1})
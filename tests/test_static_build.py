@@ -7,6 +7,8 @@ pre-flight), and the ``on_oversize`` budget policy. Any item that would need a s
 spill must raise ``EncodingError`` on these sync paths instead of silently spilling.
 """
 
+import random
+
 import pytest
 from telegram import InlineKeyboardMarkup
 
@@ -15,6 +17,12 @@ from telegram_menu_builder.encoding import CallbackEncoder
 from telegram_menu_builder.storage import MemoryStorage
 from telegram_menu_builder.types import EncodingError
 
+# Random hex does not compress, so this payload can never fit the 64-byte inline budget.
+BIG_BLOB = random.Random(0).randbytes(250).hex()
+
+# Every prefix an inline (storage-free) callback can carry.
+INLINE_PREFIXES = ("H:", "I:", "IZ:", "IC:")
+
 
 class TestToMarkup:
     """Tests for the synchronous, storage-free ``to_markup()`` builder method."""
@@ -43,7 +51,7 @@ class TestToMarkup:
         assert len(markup.inline_keyboard[0]) == 2
 
     def test_to_markup_buttons_are_inline(self, builder):
-        """Every callback button rendered by to_markup() is an inline (I:/IC:) ref."""
+        """Every callback button rendered by to_markup() is an inline (H:/I:/IZ:/IC:) ref."""
         markup = (
             builder.add_item("Item 1", handler="handler1", id=1)
             .add_item("Item 2", handler="handler2", id=2)
@@ -53,7 +61,7 @@ class TestToMarkup:
         for row in markup.inline_keyboard:
             for button in row:
                 assert button.callback_data is not None
-                assert button.callback_data.startswith(("I:", "IC:"))
+                assert button.callback_data.startswith(INLINE_PREFIXES)
 
     def test_to_markup_url_button_renders(self, builder):
         """URL buttons render through to_markup() without callback data."""
@@ -87,7 +95,7 @@ class TestToMarkup:
         for button in flat:
             if button.url is None:
                 assert button.callback_data is not None
-                assert button.callback_data.startswith(("I:", "IC:"))
+                assert button.callback_data.startswith(INLINE_PREFIXES)
 
     async def test_to_markup_round_trips_through_encoder(self, storage):
         """A to_markup() button's callback_data decodes back to the original action."""
@@ -104,7 +112,7 @@ class TestToMarkup:
 
     def test_to_markup_oversize_raises(self, builder):
         """An item too large to fit inline makes to_markup() raise EncodingError."""
-        builder.add_item("Big", handler="big_handler", blob="x" * 500)
+        builder.add_item("Big", handler="big_handler", blob=BIG_BLOB)
 
         with pytest.raises(EncodingError):
             builder.to_markup()
@@ -145,7 +153,7 @@ class TestToRaw:
 
         callback_button = next(b for b in flat if "callback_data" in b)
         assert callback_button["text"] == "Callback"
-        assert callback_button["callback_data"].startswith(("I:", "IC:"))
+        assert callback_button["callback_data"].startswith(INLINE_PREFIXES)
         assert "url" not in callback_button
 
         url_button = next(b for b in flat if "url" in b)
@@ -169,11 +177,11 @@ class TestToRaw:
         assert any("Back" in text for text in texts)
         for button in flat:
             assert "callback_data" in button
-            assert button["callback_data"].startswith(("I:", "IC:"))
+            assert button["callback_data"].startswith(INLINE_PREFIXES)
 
     def test_to_raw_oversize_raises(self, builder):
         """An item too large to fit inline makes to_raw() raise EncodingError."""
-        builder.add_item("Big", handler="big_handler", blob="x" * 500)
+        builder.add_item("Big", handler="big_handler", blob=BIG_BLOB)
 
         with pytest.raises(EncodingError):
             builder.to_raw()
@@ -200,9 +208,7 @@ class TestAssertInline:
 
     def test_assert_inline_raises_for_oversize_item(self, storage):
         """assert_inline() raises EncodingError when an item would need storage."""
-        builder = MenuBuilder(storage=storage).add_item(
-            "Big", handler="big_handler", blob="x" * 500
-        )
+        builder = MenuBuilder(storage=storage).add_item("Big", handler="big_handler", blob=BIG_BLOB)
 
         with pytest.raises(EncodingError):
             builder.assert_inline()
@@ -219,7 +225,7 @@ class TestOnOversizePolicy:
     async def test_default_spills_on_oversize(self, storage):
         """The default builder (on_oversize='spill') spills oversize items to storage."""
         builder = MenuBuilder(storage=storage)
-        builder.add_item("Big", handler="big_handler", blob="x" * 500)
+        builder.add_item("Big", handler="big_handler", blob=BIG_BLOB)
 
         menu = await builder.build_async()
         callback_data = menu.inline_keyboard[0][0].callback_data
@@ -230,7 +236,7 @@ class TestOnOversizePolicy:
     async def test_error_policy_raises_on_oversize(self, storage):
         """on_oversize='error' makes build_async raise instead of spilling."""
         builder = MenuBuilder(storage=storage, on_oversize="error")
-        builder.add_item("Big", handler="big_handler", blob="x" * 500)
+        builder.add_item("Big", handler="big_handler", blob=BIG_BLOB)
 
         with pytest.raises(EncodingError):
             await builder.build_async()
@@ -244,4 +250,4 @@ class TestOnOversizePolicy:
         callback_data = menu.inline_keyboard[0][0].callback_data
 
         assert callback_data is not None
-        assert callback_data.startswith(("I:", "IC:"))
+        assert callback_data.startswith(INLINE_PREFIXES)
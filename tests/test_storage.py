@@ -46,8 +46,8 @@ class TestMemoryStorage:
         await storage.set("k", {"value": 1}, ttl=60)
         assert await storage.exists("k") is True
 
-        future = time_module.time() + 120
-        monkeypatch.setattr("telegram_menu_builder.storage.memory.time.time", lambda: future)
+        future = time_module.monotonic() + 120
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
 
         assert await storage.get("k") is None
         assert await storage.exists("k") is False
@@ -70,8 +70,8 @@ class TestMemoryStorage:
         assert await storage.add("k", {"user_id": 1}, ttl=60) is True
         assert await storage.add("k", {"user_id": 2}, ttl=60) is False
 
-        future = time_module.time() + 120
-        monkeypatch.setattr("telegram_menu_builder.storage.memory.time.time", lambda: future)
+        future = time_module.monotonic() + 120
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
 
         assert await storage.add("k", {"user_id": 3}, ttl=60) is True
         assert await storage.get("k") == {"user_id": 3}
@@ -106,13 +106,63 @@ class TestMemoryStorage:
         await storage.set("a", {"v": 1}, ttl=60)
         await storage.set("b", {"v": 2})  # no ttl
 
-        future = time_module.time() + 120
-        monkeypatch.setattr("telegram_menu_builder.storage.memory.time.time", lambda: future)
+        future = time_module.monotonic() + 120
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
 
         removed = await storage.cleanup_expired()
         assert removed == 1
         assert set(await storage.keys()) == {"b"}
 
+    async def test_cleanup_skips_keys_reset_with_longer_ttl(self, storage, monkeypatch):
+        """A stale expiry entry does not remove a key that was re-set or deleted."""
+        await storage.set("a", {"v": 1}, ttl=60)
+        await storage.set("a", {"v": 2}, ttl=600)
+        await storage.set("b", {"v": 3}, ttl=60)
+        await storage.set("b", {"v": 4})  # ttl cleared
+        await storage.set("c", {"v": 5}, ttl=60)
+        await storage.delete("c")
+
+        future = time_module.monotonic() + 120
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
+
+        assert await storage.cleanup_expired() == 0
+        assert await storage.get("a") == {"v": 2}
+        assert await storage.get("b") == {"v": 4}
+
+    async def test_bulk_expiry_keeps_live_keys(self, storage, monkeypatch):
+        """When most keys expire at once, only the expired ones are dropped."""
+        for n in range(20):
+            await storage.set(f"burst:{n}", {"v": n}, ttl=60)
+        await storage.set("live", {"v": "ttl"}, ttl=600)
+        await storage.set("forever", {"v": "no ttl"})
+
+        future = time_module.monotonic() + 120
+        monkeypatch.setattr("telegram_menu_builder.storage.memory._now", lambda: future)
+
+        assert await storage.cleanup_expired() == 20
+        assert set(await storage.keys()) == {"live", "forever"}
+        assert storage.get_stats()["keys_with_ttl"] == 1
+
+    async def test_expiry_index_stays_bounded(self, storage):
+        """Re-setting the same key does not grow the expiry index without bound."""
+        for n in range(100):
+            await storage.set("k", {"v": n}, ttl=60)
+
+        assert len(storage._expiry_heap) <= 2
+
+    async def test_batch_operations(self, storage):
+        """mget/mset/mdelete mirror get/set/delete for several keys at once."""
+        await storage.mset({"a": {"v": 1}, "b": {"v": 2}}, ttl=60)
+
+        assert await storage.mget(["a", "missing", "b"]) == [{"v": 1}, None, {"v": 2}]
+        assert await storage.mget([]) == []
+        assert await storage.mdelete(["a", "missing"]) == 1
+        assert await storage.mget(["a", "b"]) == [None, {"v": 2}]
+
+    def test_uses_slots(self, storage):
+        """MemoryStorage carries no per-instance __dict__."""
+        assert not hasattr(storage, "__dict__")
+
     async def test_get_stats(self, storage):
         """get_stats reports counts about stored keys."""
         await storage.set("a", {"v": 1}, ttl=60)
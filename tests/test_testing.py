@@ -6,6 +6,8 @@ convenience (encodes a handler+params then simulates), the ``TapResult`` record,
 ``assert_inline`` (verifies every button is an inline callback ref, not a storage ref).
 """
 
+import random
+
 import pytest
 
 from telegram_menu_builder import MenuBuilder, MenuRouter
@@ -13,6 +15,9 @@ from telegram_menu_builder.storage import MemoryStorage
 from telegram_menu_builder.testing import TapResult, assert_inline, simulate_tap, tap
 from telegram_menu_builder.types import MenuAction
 
+# Random hex does not compress, so this payload can never fit the 64-byte inline budget.
+BIG_BLOB = random.Random(0).randbytes(250).hex()
+
 
 class TestSimulateTap:
     """Tests for simulate_tap driving a router via a fabricated Update."""
@@ -131,7 +136,7 @@ class TestAssertInline:
     async def test_assert_inline_raises_on_spilled_markup(self, storage):
         """assert_inline raises AssertionError on a built menu that spilled to storage."""
         builder = MenuBuilder(storage=storage)
-        builder.add_item("Big", handler="big_handler", blob="x" * 500)
+        builder.add_item("Big", handler="big_handler", blob=BIG_BLOB)
         markup = await builder.build_async()
 
         # The oversize item spilled to storage (S:/P:), so this is not inline.
@@ -5,12 +5,17 @@ from pydantic import ValidationError as PydanticValidationError
 
 from telegram_menu_builder.types import (
     CallbackData,
+    DecodingError,
+    EncodingError,
     LayoutConfig,
     MenuAction,
+    MenuBuilderError,
     MenuItem,
     NavigationButton,
     NavigationConfig,
+    StorageError,
     StorageStrategy,
+    ValidationError,
 )
 
 
@@ -27,10 +32,45 @@ class TestMenuAction:
         with pytest.raises(PydanticValidationError):
             MenuAction(handler="bad name!")
 
+    def test_handler_name_edge_cases(self):
+        """Unicode letters are accepted; names made only of '_' and '.' are rejected."""
+        assert MenuAction(handler="menù.ñandú").handler == "menù.ñandú"
+        for name in ("_", "._.", "a-b"):
+            with pytest.raises(PydanticValidationError):
+                MenuAction(handler=name)
+
     def test_params_must_be_json_serializable(self):
         """Non-serializable params raise a validation error."""
         with pytest.raises(PydanticValidationError):
             MenuAction(handler="h", params={"obj": object()})
+        with pytest.raises(PydanticValidationError):
+            MenuAction(handler="h", params={"nested": [{"obj": object()}]})
+
+    def test_plain_json_params_skip_serialization(self, monkeypatch):
+        """Params built from plain JSON types are accepted without calling json.dumps."""
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("plain JSON params should not be serialized")
+
+        monkeypatch.setattr("telegram_menu_builder.types.json.dumps", _fail)
+        params = {
+            "id": 1,
+            "ratio": 0.5,
+            "flags": [True, None, ("a", 2)],
+            "nested": {"b": [2, 3, 4], "c": {}},
+        }
+
+        assert MenuAction(handler="h", params=params).params == params
+
+    def test_shared_and_cyclic_params(self):
+        """A value referenced twice is fine; a cycle is rejected like json.dumps does."""
+        shared = [1, 2]
+        assert MenuAction(handler="h", params={"a": shared, "b": shared}).params["b"] == shared
+
+        cyclic: list = []
+        cyclic.append(cyclic)
+        with pytest.raises(PydanticValidationError, match="Circular reference"):
+            MenuAction(handler="h", params={"loop": cyclic})
 
     def test_ttl_bounds(self):
         """ttl is bounded to [60, 86400]."""
@@ -57,7 +97,7 @@ class TestMenuItem:
     def test_callback_size_counts_utf8_bytes(self):
         """Multi-byte characters count by their UTF-8 byte length."""
         # Each rocket emoji is 4 UTF-8 bytes; 17 * 4 = 68 > 64.
-        with pytest.raises(PydanticValidationError):
+        with pytest.raises(PydanticValidationError, match="64-byte limit: 68 bytes"):
             MenuItem(text="ok", callback_data="🚀" * 17)
 
     def test_item_is_frozen(self):
@@ -83,6 +123,23 @@ class TestMenuItem:
         button = MenuItem(text="x").to_telegram_button()
         assert button.callback_data == ""
 
+    def test_to_telegram_button_is_cached(self):
+        """The button is built once per item and does not affect item equality."""
+        item = MenuItem(text="Go", callback_data="data")
+
+        button = item.to_telegram_button()
+
+        assert item.to_telegram_button() is button
+        assert item == MenuItem(text="Go", callback_data="data")
+        assert item.model_dump() == {"text": "Go", "callback_data": "data", "url": None}
+
+    def test_equal_items_share_a_button(self):
+        """Equal items (e.g. the same menu built twice) reuse one button."""
+        first = MenuItem(text="Go", callback_data="shared").to_telegram_button()
+
+        assert MenuItem(text="Go", callback_data="shared").to_telegram_button() is first
+        assert MenuItem(text="Go", callback_data="other").to_telegram_button() is not first
+
 
 class TestLayoutConfig:
     """Tests for LayoutConfig bounds."""
@@ -122,6 +179,12 @@ class TestNavigationConfig:
         config = NavigationConfig(back_button=NavigationButton(text="Back", handler="go_back"))
         assert config.back_button is not None
 
+    def test_navigation_button_is_frozen(self):
+        """NavigationButton is immutable once built."""
+        button = NavigationButton(text="Back", handler="go_back")
+        with pytest.raises(PydanticValidationError):
+            button.text = "changed"
+
 
 class TestStorageStrategy:
     """Tests for the StorageStrategy enum."""
@@ -142,3 +205,23 @@ class TestCallbackData:
         assert data.action.handler == "h"
         assert data.menu_id is None
         assert data.metadata == {}
+
+    def test_is_frozen(self):
+        """CallbackData is immutable once built."""
+        data = CallbackData(action=MenuAction(handler="h"))
+        with pytest.raises(PydanticValidationError):
+            data.menu_id = "other"
+
+
+class TestExceptions:
+    """Tests for the MenuBuilderError hierarchy."""
+
+    @pytest.mark.parametrize(
+        "error_type",
+        [MenuBuilderError, EncodingError, DecodingError, StorageError, ValidationError],
+    )
+    def test_adds_no_instance_layout(self, error_type):
+        """Each exception class declares empty slots on top of Exception."""
+        assert error_type.__dict__["__slots__"] == ()
+        assert error_type.__basicsize__ == Exception.__basicsize__
+        assert isinstance(error_type("boom"), MenuBuilderError)
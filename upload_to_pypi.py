@@ -23,14 +23,13 @@ def run_command(cmd: list[str], description: str) -> bool:
     print(f"  {description}")
     print(f"{'='*60}")
     
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error: {e}")
-        print(e.stderr)
+    # Inherit stdout/stderr so twine's output (including upload progress) streams
+    # straight to the terminal instead of being buffered until it exits.
+    result = subprocess.run(cmd, check=False)
+    if result.returncode != 0:
+        print(f"❌ Error: command exited with status {result.returncode}: {' '.join(cmd[:2])}")
         return False
+    return True
 
 
 def main():
@@ -56,7 +55,9 @@ def main():
         print("❌ dist/ folder not found. Run 'python -m build' first.")
         sys.exit(1)
     
-    files = list(dist_path.glob("*.whl")) + list(dist_path.glob("*.tar.gz"))
+    wheels = list(dist_path.glob("*.whl"))
+    sdists = list(dist_path.glob("*.tar.gz"))
+    files = wheels + sdists
     if not files:
         print("❌ No distribution files found in dist/")
         sys.exit(1)
@@ -84,7 +85,12 @@ def main():
     if token:
         cmd.extend(["-u", "__token__", "-p", token])
     
-    cmd.extend([f"dist/{f.name}" for f in files])
+    # twine expands the patterns itself, but rejects one that matches nothing, so only
+    # pass the patterns that found files above.
+    if wheels:
+        cmd.append("dist/*.whl")
+    if sdists:
+        cmd.append("dist/*.tar.gz")
     
     # Step 4: Upload
     if run_command(cmd, f"Uploading to {'TestPyPI' if test_mode else 'PyPI'}"):